@@ -49,6 +49,13 @@ DEFAULT_ENABLE_CACHE = False
 DEFAULT_METADATA_DATETIME_SUFFIXES = ['_date', '_datetime']
 DEFAULT_OPENSEARCH_ENGINE = 'nmslib'
 DEFAULT_ENABLE_VERSIONING = False
+DEFAULT_HASH_ALGORITHM = 'md5'
+
+# Per-service botocore settings for ResilientClient; the S3 client is shared by concurrent
+# downloads and reads, so it gets a larger connection pool than botocore's default of 10
+AWS_CLIENT_CONFIGS = {
+    's3': Config(max_pool_connections=50)
+}
 
 def _is_json_string(s):
     """
@@ -130,7 +137,7 @@ class ResilientClient:
             RuntimeError: If the AWS SSO token is missing or expired
         """
         try:
-            return self.config.session.client(self.service_name)
+            return self.config.session.client(self.service_name, config=AWS_CLIENT_CONFIGS.get(self.service_name))
         except SSOTokenLoadError as e:
             raise RuntimeError(
                 f"[ResilientClient] SSO token is missing or expired for profile '{self.config.aws_profile}'.\n"
@@ -287,6 +294,7 @@ class _GraphRAGConfig:
     _metadata_datetime_suffixes: Optional[List[str]] = None
     _opensearch_engine: Optional[str] = None
     _enable_versioning = None
+    _hash_algorithm: Optional[str] = None
 
     @contextlib.contextmanager
     def _validate_sso_token(self, profile):
@@ -1167,5 +1175,26 @@ class _GraphRAGConfig:
     def enable_versioning(self, enable_versioning: bool) -> None:
         self._enable_versioning = enable_versioning
 
+    @property
+    def hash_algorithm(self) -> str:
+        """
+        The hash algorithm used to generate node IDs ('md5', 'blake3' or 'sha256').
+
+        Defaults to 'md5', which keeps IDs compatible with existing graphs. Changing
+        the algorithm changes every generated ID, so it should only be set for new graphs.
+        Names are case-insensitive; an unsupported name raises a ValueError.
+
+        Returns:
+            str: The lowercase name of the hash algorithm.
+        """
+        if self._hash_algorithm is None:
+            from graphrag_toolkit.lexical_graph.indexing.utils.hash_utils import normalize_hash_algorithm
+            self._hash_algorithm = normalize_hash_algorithm(os.environ.get('HASH_ALGORITHM', DEFAULT_HASH_ALGORITHM))
+        return self._hash_algorithm
+
+    @hash_algorithm.setter
+    def hash_algorithm(self, hash_algorithm: str) -> None:
+        from graphrag_toolkit.lexical_graph.indexing.utils.hash_utils import normalize_hash_algorithm
+        self._hash_algorithm = normalize_hash_algorithm(hash_algorithm)
 
 GraphRAGConfig = _GraphRAGConfig()
\ No newline at end of file
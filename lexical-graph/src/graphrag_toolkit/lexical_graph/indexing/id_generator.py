@@ -1,15 +1,63 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional, Tuple
 
-from graphrag_toolkit.lexical_graph import TenantId, GraphRAGConfig
-from graphrag_toolkit.lexical_graph.indexing.utils.hash_utils import get_hash
+from graphrag_toolkit.lexical_graph import TenantId, DEFAULT_TENANT_ID, GraphRAGConfig
+from graphrag_toolkit.lexical_graph.indexing.utils.hash_utils import get_hash, get_hash_parts, get_hash_prefix, get_affixed_hash, normalize_hash_algorithm
 from graphrag_toolkit.lexical_graph.utils.arg_utils import first_non_none
 
-from llama_index.core.bridge.pydantic import BaseModel
+_HASHABLE_PROBE = '\x00probe\x00'
 
-class IdGenerator(BaseModel):
+# Maximum number of node IDs memoized across IdGenerator instances
+NODE_ID_CACHE_SIZE = 131072
+
+# Delimiter used to separate text and metadata in chunk ID hashing.
+# The null character is valid in str values, so text or metadata containing it can
+# still produce boundary collisions.
+_CHUNK_ID_DELIMITER = '\x00'
+# Delimiter used by use_byte_chunk_id_delimiter. 0xFF never occurs in UTF-8 encoded
+# text, so no two (text, metadata) pairs can hash the same byte sequence.
+_CHUNK_ID_DELIMITER_BYTE = b'\xff'
+
+# Lowercases A-Z and maps ' ' to '_' in a single table-driven pass over ASCII bytes
+_ASCII_KEY_TABLE = bytes.maketrans(
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZ ',
+    b'abcdefghijklmnopqrstuvwxyz_'
+)
+
+def _node_key(node_type:str, v1:str, v2:Optional[str]=None) -> str:
+    """
+    Builds the normalized (lowercased, spaces replaced with underscores) key for a node.
+
+    ASCII keys are normalized in a single translate pass over the joined string. Non-ASCII
+    values are normalized part by part, because Unicode lowercasing is
+    context-sensitive (e.g. Greek final sigma) and could otherwise change
+    across the '::' boundaries.
+    """
+    key = f'{node_type}::{v1}::{v2}' if v2 else f'{node_type}::{v1}'
+    if key.isascii():
+        return key.encode('ascii').translate(_ASCII_KEY_TABLE).decode('ascii')
+    if v2:
+        return f"{node_type.lower()}::{v1.lower().replace(' ', '_')}::{v2.lower().replace(' ', '_')}"
+    else:
+        return f"{node_type.lower()}::{v1.lower().replace(' ', '_')}"
+
+@lru_cache(maxsize=NODE_ID_CACHE_SIZE)
+def _cached_node_id(hashable_affix:Tuple[str,str], hash_algorithm:str, node_type:str, v1:str, v2:Optional[str]) -> str:
+    """
+    Memoized node ID creation. Entity and fact values recur across chunks and
+    documents, so repeated values skip normalization and hashing. The tenant affix and
+    hash algorithm are part of the key, so generators with different settings share
+    the cache safely. Use `_cached_node_id.cache_info()` to inspect hit rates.
+    """
+    prefix, suffix = hashable_affix
+    return get_affixed_hash(prefix, _node_key(node_type, v1, v2), suffix, hash_algorithm)
+
+@dataclass(slots=True)
+class IdGenerator:
     """
     A class responsible for generating unique and tenant-specific identifiers.
 
@@ -19,38 +67,55 @@ class IdGenerator(BaseModel):
     of input values. The class also integrates with a tenant system to ensure
     that identifiers are applied in the context of a particular tenant.
 
+    `IdGenerator` is a slotted dataclass rather than a Pydantic model because its
+    attributes are read for every ID generated during indexing.
+
     Attributes:
         tenant_id (TenantId): The tenant context that is used for generating
             tenant-specific IDs and rewriting ID values.
+        include_classification_in_entity_id (bool): Whether to include classification
+            in entity IDs. Defaults to `GraphRAGConfig.include_classification_in_entity_id`.
         use_chunk_id_delimiter (bool): Whether to use delimiter in chunk ID hashing
-            to prevent boundary collisions. Defaults to False for backward compatibility.
+            to prevent boundary collisions. Defaults to False for backward compatibility
+            with existing graphs. Set to True for new graphs to enable collision-resistant hashing.
+        use_byte_chunk_id_delimiter (bool): Whether to separate text and metadata with a 0xFF
+            byte, which cannot occur in UTF-8 text, rather than a null character, which can.
+            Takes precedence over `use_chunk_id_delimiter`. Defaults to False; changes chunk
+            IDs, so only enable it for new graphs.
+        hash_algorithm (str): The hash algorithm used to generate IDs ('md5', 'blake3' or 'sha256').
+            Defaults to `GraphRAGConfig.hash_algorithm` ('md5'). Names are case-insensitive, and an
+            unsupported name raises a ValueError. Changing the algorithm changes every generated ID,
+            so only use a non-default algorithm for new graphs.
     """
-    tenant_id:TenantId
-    include_classification_in_entity_id:bool
-    use_chunk_id_delimiter:bool
-
-    def __init__(self, tenant_id:TenantId=None, include_classification_in_entity_id:bool=None, use_chunk_id_delimiter:bool=False):
-        """
-        Initialize the IdGenerator.
-
-        Args:
-            tenant_id: The tenant context for generating tenant-specific IDs.
-            include_classification_in_entity_id: Whether to include classification in entity IDs.
-            use_chunk_id_delimiter: Whether to use delimiter in chunk ID hashing to prevent
-                boundary collisions. Defaults to False for backward compatibility with existing
-                graphs. Set to True for new graphs to enable collision-resistant hashing.
-        """
-        super().__init__(
-            tenant_id=tenant_id or TenantId(),
-            include_classification_in_entity_id=first_non_none([include_classification_in_entity_id, GraphRAGConfig.include_classification_in_entity_id]),
-            use_chunk_id_delimiter=use_chunk_id_delimiter
-        )
+    tenant_id:TenantId = None
+    include_classification_in_entity_id:bool = None
+    use_chunk_id_delimiter:bool = False
+    use_byte_chunk_id_delimiter:bool = False
+    hash_algorithm:str = None
+
+    _hashable_affix:Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.tenant_id = self.tenant_id or DEFAULT_TENANT_ID
+        self.include_classification_in_entity_id = first_non_none([self.include_classification_in_entity_id, GraphRAGConfig.include_classification_in_entity_id])
+        self.hash_algorithm = normalize_hash_algorithm(first_non_none([self.hash_algorithm, GraphRAGConfig.hash_algorithm]))
+        # The tenant's hashable format is fixed for the lifetime of the generator, so
+        # resolve its prefix and suffix once rather than calling format_hashable per ID
+        prefix, probe, suffix = self.tenant_id.format_hashable(_HASHABLE_PROBE).partition(_HASHABLE_PROBE)
+        if probe:
+            self._hashable_affix = (prefix, suffix)
+
+    def _format_hashable(self, key:str) -> str:
+        if self._hashable_affix is None:
+            return self.tenant_id.format_hashable(key)
+        prefix, suffix = self._hashable_affix
+        return prefix + key + suffix
 
     def _get_hash(self, s):
         """
-        Generates an MD5 hash for a given string.
+        Generates a hash for a given string using the configured hash algorithm.
 
-        This private method computes the MD5 hash of a provided string and returns its
+        This private method computes the hash of a provided string and returns its
         hexadecimal representation. It is used internally to generate unique hashed
         values based on string inputs.
 
@@ -58,9 +123,9 @@ class IdGenerator(BaseModel):
             s: The input string to be hashed.
 
         Returns:
-            The hexadecimal representation of the MD5 hash of the input string.
+            The hexadecimal representation of the hash of the input string.
         """
-        return get_hash(s)
+        return get_hash(s, self.hash_algorithm)
 
     def create_source_id(self, text:str, metadata_str:str):
         """
@@ -81,11 +146,8 @@ class IdGenerator(BaseModel):
             hashed substrings derived from the input text and metadata.
 
         """
-        return f"aws::{self._get_hash(text)[:8]}:{self._get_hash(metadata_str)[:4]}"
-
-    # Delimiter used to separate text and metadata in chunk ID hashing.
-    # Using null byte as it cannot appear in valid UTF-8 text strings.
-    _CHUNK_ID_DELIMITER = '\x00'
+        hash_algorithm = self.hash_algorithm
+        return f"aws::{get_hash_prefix(text, 8, hash_algorithm)}:{get_hash_prefix(metadata_str, 4, hash_algorithm)}"
 
     def create_chunk_id(self, source_id:str, text:str, metadata_str:str):
         """
@@ -94,10 +156,13 @@ class IdGenerator(BaseModel):
 
         When use_chunk_id_delimiter is enabled, the text and metadata are separated by a null
         byte delimiter before hashing to prevent boundary collision issues where different
-        (text, metadata_str) pairs could produce identical concatenated strings.
+        (text, metadata_str) pairs could produce identical concatenated strings. Text that
+        itself contains null characters can still collide; use_byte_chunk_id_delimiter
+        separates the parts with a 0xFF byte instead, which cannot occur in UTF-8 text.
 
         For backward compatibility with existing graphs, the delimiter is disabled by default.
-        Enable it for new graphs by setting use_chunk_id_delimiter=True during initialization.
+        Enable it for new graphs by setting use_byte_chunk_id_delimiter=True (or
+        use_chunk_id_delimiter=True) during initialization.
 
         Args:
             source_id (str): The identifier of the source content.
@@ -107,14 +172,18 @@ class IdGenerator(BaseModel):
         Returns:
             str: A uniquely generated chunk identifier based on the given inputs.
         """
-        if self.use_chunk_id_delimiter:
+        # Parts are hashed incrementally, so the (potentially large) text is never
+        # copied into a concatenated string
+        if self.use_byte_chunk_id_delimiter:
+            hash_parts = (text, _CHUNK_ID_DELIMITER_BYTE, metadata_str)
+        elif self.use_chunk_id_delimiter:
             # New behavior: Use delimiter to prevent boundary collisions
-            hash_input = text + self._CHUNK_ID_DELIMITER + metadata_str
+            hash_parts = (text, _CHUNK_ID_DELIMITER, metadata_str)
         else:
             # Old behavior: Direct concatenation (preserves existing chunk IDs)
-            hash_input = text + metadata_str
+            hash_parts = (text, metadata_str)
 
-        return f'{source_id}:{self._get_hash(hash_input)[:8]}'
+        return f'{source_id}:{get_hash_parts(hash_parts, self.hash_algorithm)[:8]}'
 
     def rewrite_id_for_tenant(self, id_value:str):
         """
@@ -132,16 +201,20 @@ class IdGenerator(BaseModel):
         return self.tenant_id.rewrite_id(id_value)
 
     def create_topic_id(self, source_id:str, topic_value:str) -> str:
-        return self._create_node_id('topic', source_id, topic_value)
+        # Topic IDs are keyed by source, so they are almost never repeated across sources
+        # and would only churn the node ID cache
+        return self._create_node_id('topic', source_id, topic_value, use_cache=False)
 
     def create_statement_id(self, topic_id:str, statement_value:str) -> str:
-        return self._create_node_id('statement', topic_id, statement_value)
+        # Statement values are effectively unique, so they would only churn the node ID cache
+        return self._create_node_id('statement', topic_id, statement_value, use_cache=False)
 
     def create_fact_id(self, fact_value:str) -> str:
         return self._create_node_id('fact', fact_value)
 
     def create_local_entity_id(self, source_id:str, entity_value:str) -> str:
-        return self._create_node_id('local-entity', entity_value, source_id)
+        # Scoped to a source, like topic IDs, so not cached
+        return self._create_node_id('local-entity', entity_value, source_id, use_cache=False)
 
     def create_entity_id(self, entity_value:str, entity_classification:str) -> str:
         if self.include_classification_in_entity_id:
@@ -149,7 +222,7 @@ class IdGenerator(BaseModel):
         else:
             return self._create_node_id('entity', entity_value)
 
-    def _create_node_id(self, node_type:str, v1:str, v2:Optional[str]=None) -> str:
+    def _create_node_id(self, node_type:str, v1:str, v2:Optional[str]=None, use_cache:bool=True) -> str:
         """
         Creates a unique identifier for a specific node based on the provided parameters.
 
@@ -163,11 +236,15 @@ class IdGenerator(BaseModel):
             v1: A string specifying the first variable or identifier in the node's identity.
             v2: An optional string specifying the second variable or identifier
                 in the node's identity.
+            use_cache: Whether to memoize the identifier for repeated values.
 
         Returns:
             A string containing a unique hash-based identifier for the node.
         """
-        if v2:
-            return self._get_hash(self.tenant_id.format_hashable(f"{node_type.lower()}::{v1.lower().replace(' ', '_')}::{v2.lower().replace(' ', '_')}"))
-        else:
-            return self._get_hash(self.tenant_id.format_hashable(f"{node_type.lower()}::{v1.lower().replace(' ', '_')}"))
+        hashable_affix = self._hashable_affix
+        if hashable_affix is None:
+            return self._get_hash(self._format_hashable(_node_key(node_type, v1, v2)))
+        if not use_cache:
+            prefix, suffix = hashable_affix
+            return get_affixed_hash(prefix, _node_key(node_type, v1, v2), suffix, self.hash_algorithm)
+        return _cached_node_id(hashable_affix, self.hash_algorithm, node_type, v1, v2)
@@ -23,9 +23,11 @@ class LlamaIndexReaderProviderBase(ReaderProvider):
         Read documents using the underlying LlamaIndex reader.
         Subclasses should override this method to handle specific reader requirements.
         """
-        logger.debug("Starting read()")
-        logger.debug(f"Reader class: {self._reader.__class__.__name__}")
-        logger.debug(f"Input source: {input_source} (type={type(input_source)})")
+        # input_source may be a long list of paths or records: only format it when it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Starting read()")
+            logger.debug(f"Reader class: {self._reader.__class__.__name__}")
+            logger.debug(f"Input source: {input_source} (type={type(input_source)})")
 
         try:
             # Default implementation - subclasses should override for specific readers
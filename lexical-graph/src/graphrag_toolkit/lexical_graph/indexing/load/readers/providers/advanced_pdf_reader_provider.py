@@ -1,4 +1,6 @@
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional
 import fitz  # pymupdf
 import base64
 from llama_index.core.schema import Document
@@ -9,46 +11,132 @@ from graphrag_toolkit.lexical_graph.logging import logging
 
 logger = logging.getLogger(__name__)
 
+# Documents with fewer pages than this are processed in the calling process:
+# for short documents, worker start-up costs more than it saves.
+PARALLEL_PAGE_THRESHOLD = 8
+
+# Pages are split into this many batches per worker, so that workers that finish
+# early pick up more work; each worker parses the document only once regardless.
+BATCHES_PER_WORKER = 4
+
+# Only the first 100 base64 characters of each image are kept, and those
+# encode exactly the first 75 bytes of the image data.
+IMAGE_B64_PREFIX_CHARS = 100
+IMAGE_B64_PREFIX_BYTES = IMAGE_B64_PREFIX_CHARS * 3 // 4
+
+# Image modes: 'b64_prefix' decodes each image and records the start of its
+# base64-encoded PNG; 'metadata' records only the image xref and size, without
+# decoding any image data.
+IMAGE_MODE_B64_PREFIX = 'b64_prefix'
+IMAGE_MODE_METADATA = 'metadata'
+IMAGE_MODES = [IMAGE_MODE_B64_PREFIX, IMAGE_MODE_METADATA]
+
+def _get_image_b64_prefix(doc, xref:int) -> Optional[str]:
+    # The pixmap is local to this function, so it is released as soon as the prefix is computed
+    pix = fitz.Pixmap(doc, xref)
+    if pix.n - pix.alpha < 4:
+        img_data = pix.tobytes("png")
+        return base64.b64encode(img_data[:IMAGE_B64_PREFIX_BYTES]).decode()
+    return None
+
+def _extract_page_text(doc, page_num:int, image_mode:str, image_cache:Dict[int, Optional[str]]) -> str:
+    page = doc[page_num]
+    # Image markers are collected and joined once, rather than growing the page text per image
+    parts = [page.get_text()]
+    
+    image_list = page.get_images(full=False)
+    
+    if image_mode == IMAGE_MODE_METADATA:
+        for img_index, (xref, _, width, height, *_) in enumerate(image_list):
+            parts.append(f"\n[IMAGE_{page_num}_{img_index}: xref={xref}, size={width}x{height}]")
+        return ''.join(parts)
+    
+    xrefs = [img[0] for img in image_list]
+    for img_index, xref in enumerate(xrefs):
+        try:
+            # Images shared between pages (logos, headers) are decoded once per document
+            if xref not in image_cache:
+                image_cache[xref] = _get_image_b64_prefix(doc, xref)
+            img_b64 = image_cache[xref]
+            if img_b64 is not None:
+                parts.append(f"\n[IMAGE_{page_num}_{img_index}: base64_data={img_b64}...]")
+        except Exception as e:
+            logger.warning(f"Failed to extract image {img_index} from page {page_num}: {e}")
+    
+    return ''.join(parts)
+
+# Per-process document handle and image cache, set up once by _init_worker so that
+# every batch of pages scheduled to a worker reuses the same parsed document
+_worker_doc = None
+_worker_image_cache = None
+
+def _init_worker(pdf_path:str):
+    global _worker_doc, _worker_image_cache
+    _worker_doc = fitz.open(pdf_path)
+    _worker_image_cache = {}
+
+def _extract_page_texts(image_mode:str, page_nums:range) -> List[str]:
+    """Extract the text of a range of pages using the worker process's document handle."""
+    return [_extract_page_text(_worker_doc, page_num, image_mode, _worker_image_cache) for page_num in page_nums]
+
+def _split_pages(page_count:int, num_batches:int) -> List[range]:
+    batch_size = -(-page_count // num_batches)
+    return [range(start, min(start + batch_size, page_count)) for start in range(0, page_count, batch_size)]
+
 class AdvancedPDFReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
     """Advanced PDF reader with image and table extraction."""
 
     def __init__(self, config: PDFReaderConfig):
+        if config.image_mode not in IMAGE_MODES:
+            raise ValueError(f"Unsupported image_mode: '{config.image_mode}'. Supported modes: {IMAGE_MODES}")
         self.config = config
         self.metadata_fn = config.metadata_fn
         logger.debug("Initialized AdvancedPDFReaderProvider")
 
+    def _get_num_workers(self, page_count:int) -> int:
+        # Worker processes are opt-in: each one re-opens the PDF, and process pools are
+        # unavailable in some runtimes (e.g. AWS Lambda)
+        num_workers = self.config.num_workers or 1
+        if num_workers <= 1 or page_count < PARALLEL_PAGE_THRESHOLD:
+            return 1
+        return min(num_workers, page_count)
+
     def read(self, input_source) -> List[Document]:
         """Read PDF with text, images, and tables."""
         if not input_source:
             logger.error("No input source provided to AdvancedPDFReaderProvider")
             raise ValueError("input_source cannot be None or empty")
         
-        logger.info(f"Reading advanced PDF from: {input_source}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Reading advanced PDF from: {input_source}")
         processed_paths, temp_files, original_paths = self._process_file_paths(input_source)
         
         try:
             pdf_path = processed_paths[0]
             logger.debug(f"Opening PDF file: {pdf_path}")
-            doc = fitz.open(pdf_path)
-            documents = []
+            with fitz.open(pdf_path) as doc:
+                page_count = len(doc)
+                num_workers = self._get_num_workers(page_count)
+                if num_workers <= 1:
+                    image_cache = {}
+                    page_texts = [_extract_page_text(doc, page_num, self.config.image_mode, image_cache) for page_num in range(page_count)]
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text()
-                
-                image_list = page.get_images()
-                for img_index, img in enumerate(image_list):
-                    try:
-                        xref = img[0]
-                        pix = fitz.Pixmap(doc, xref)
-                        if pix.n - pix.alpha < 4:
-                            img_data = pix.tobytes("png")
-                            img_b64 = base64.b64encode(img_data).decode()
-                            text += f"\n[IMAGE_{page_num}_{img_index}: base64_data={img_b64[:100]}...]"
-                        pix = None
-                    except Exception as e:
-                        logger.warning(f"Failed to extract image {img_index} from page {page_num}: {e}")
-                
+            if num_workers > 1:
+                # Pages are independent and PNG/base64 encoding is CPU-bound, so batches
+                # of pages are spread across worker processes; map() preserves page order
+                logger.debug(f"Processing {page_count} pages using {num_workers} worker processes")
+                page_batches = _split_pages(page_count, num_workers * BATCHES_PER_WORKER)
+                with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker, initargs=(pdf_path,)) as executor:
+                    page_texts = [
+                        text
+                        for batch_texts in executor.map(_extract_page_texts, repeat(self.config.image_mode), page_batches)
+                        for text in batch_texts
+                    ]
+            
+            additional_metadata = self.metadata_fn(original_paths[0]) if self.metadata_fn else None
+            
+            documents = []
+            for page_num, text in enumerate(page_texts):
                 page_doc = Document(
                     text=text,
                     metadata={
@@ -58,13 +146,11 @@ class AdvancedPDFReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
                     }
                 )
                 
-                if self.metadata_fn:
-                    additional_metadata = self.metadata_fn(original_paths[0])
+                if additional_metadata:
                     page_doc.metadata.update(additional_metadata)
                 
                 documents.append(page_doc)
             
-            doc.close()
             logger.info(f"Successfully read {len(documents)} page(s) from advanced PDF")
             return documents
             
@@ -7,23 +7,86 @@ from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
+# 'pandas' reads through LlamaIndex's PandasCSVReader; 'arrow' parses with pyarrow and
+# joins row values column-wise. Value formatting can differ slightly between the two
+# (for example, pandas renders whole floats as '1.0' where arrow renders '1', and
+# booleans as 'True' where arrow renders 'true').
+CSV_BACKEND_PANDAS = 'pandas'
+CSV_BACKEND_ARROW = 'arrow'
+CSV_BACKENDS = [CSV_BACKEND_PANDAS, CSV_BACKEND_ARROW]
+
+# Joiners used by PandasCSVReader, so that both backends lay out rows the same way
+COL_JOINER = ', '
+ROW_JOINER = '\n'
+
+class _ArrowCSVReader:
+    """Reads CSV files with pyarrow's multi-threaded parser, laying out rows as PandasCSVReader does."""
+
+    def __init__(self, concat_rows: bool = True):
+        self.concat_rows = concat_rows
+
+    def load_data(self, file: str) -> List[Document]:
+        """Read a CSV file with pyarrow and build row texts column-wise."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from pyarrow import csv
+
+        # Empty cells are read as nulls, which are rendered as 'nan' like pandas renders missing values
+        # Local files are memory-mapped, so the parser reads straight from the page cache
+        with pa.memory_map(file) as source:
+            table = csv.read_csv(
+                source,
+                read_options=csv.ReadOptions(use_threads=True),
+                convert_options=csv.ConvertOptions(strings_can_be_null=True)
+            )
+        
+        if table.num_columns == 0:
+            rows = []
+        else:
+            columns = [pc.fill_null(pc.cast(column, pa.string()), 'nan') for column in table.columns]
+            rows = pc.binary_join_element_wise(*columns, COL_JOINER).to_pylist()
+        
+        if self.concat_rows:
+            return [Document(text=ROW_JOINER.join(rows))]
+        return [Document(text=text) for text in rows]
+
+
 class CSVReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
     """Reader provider for CSV files with S3 support using LlamaIndex's PandasCSVReader."""
 
     def __init__(self, config: CSVReaderConfig):
         """Initialize with CSVReaderConfig."""
-        try:
-            from llama_index.readers.file.tabular import PandasCSVReader
-        except ImportError as e:
-            logger.error("Failed to import PandasCSVReader: missing pandas")
-            raise ImportError(
-                "PandasCSVReader requires 'pandas'. Install with: pip install pandas"
-            ) from e
-
-        reader_kwargs = {"concat_rows": config.concat_rows}
-        super().__init__(config=config, reader_cls=PandasCSVReader, **reader_kwargs)
+        if config.backend not in CSV_BACKENDS:
+            raise ValueError(f"Unsupported CSV backend: '{config.backend}'. Supported backends: {CSV_BACKENDS}")
+
+        if config.backend == CSV_BACKEND_ARROW:
+            try:
+                import pyarrow
+            except ImportError as e:
+                logger.error("Failed to import pyarrow for the arrow CSV backend")
+                raise ImportError(
+                    "The arrow CSV backend requires 'pyarrow'. Install with: pip install pyarrow"
+                ) from e
+            reader_cls = _ArrowCSVReader
+            reader_kwargs = {"concat_rows": config.concat_rows}
+        else:
+            try:
+                from llama_index.readers.file.tabular import PandasCSVReader
+            except ImportError as e:
+                logger.error("Failed to import PandasCSVReader: missing pandas")
+                raise ImportError(
+                    "PandasCSVReader requires 'pandas'. Install with: pip install pandas"
+                ) from e
+            reader_cls = PandasCSVReader
+            reader_kwargs = {
+                "concat_rows": config.concat_rows,
+                # Files are always read from local disk (S3 files are downloaded first), so memory-map them
+                "pandas_config": {"memory_map": True}
+            }
+
+        super().__init__(config=config, reader_cls=reader_cls, **reader_kwargs)
         self.metadata_fn = config.metadata_fn
-        logger.debug(f"Initialized CSVReaderProvider with concat_rows={config.concat_rows}")
+        logger.debug(f"Initialized CSVReaderProvider with concat_rows={config.concat_rows}, backend={config.backend}")
 
     def read(self, input_source) -> List[Document]:
         """Read CSV documents from local files or S3 with metadata handling."""
@@ -31,19 +94,14 @@ class CSVReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
             logger.error("No input source provided to CSVReaderProvider")
             raise ValueError("input_source cannot be None or empty")
         
-        logger.info(f"Reading CSV from: {input_source}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Reading CSV from: {input_source}")
         processed_paths, temp_files, original_paths = self._process_file_paths(input_source)
         
         try:
-            documents = self._reader.load_data(file=processed_paths[0])
+            documents = self._load_files(lambda path: self._reader.load_data(file=path), processed_paths, original_paths)
             logger.info(f"Successfully read {len(documents)} document(s) from CSV")
             
-            if self.metadata_fn:
-                for doc in documents:
-                    additional_metadata = self.metadata_fn(original_paths[0])
-                    doc.metadata.update(additional_metadata)
-                    doc.metadata['source'] = self._get_file_source_type(original_paths[0])
-            
             return documents
         except Exception as e:
             logger.error(f"Failed to read CSV from {input_source}: {e}", exc_info=True)
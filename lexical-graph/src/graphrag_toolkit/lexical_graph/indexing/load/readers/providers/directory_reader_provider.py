@@ -43,8 +43,8 @@ class DirectoryReaderProvider(LlamaIndexReaderProviderBase):
             
             if self.metadata_fn:
                 source_path = input_source or self.directory_config.input_dir
+                additional_metadata = self.metadata_fn(source_path)
                 for doc in documents:
-                    additional_metadata = self.metadata_fn(source_path)
                     doc.metadata.update(additional_metadata)
             
             return documents
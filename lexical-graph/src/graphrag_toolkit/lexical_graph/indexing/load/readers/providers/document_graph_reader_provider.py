@@ -1,3 +1,4 @@
+import json
 from typing import List, Dict, Any
 from graphrag_toolkit.lexical_graph.indexing.load.readers.llama_index_reader_provider_base import LlamaIndexReaderProviderBase
 from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import DocumentGraphReaderConfig
@@ -6,6 +7,16 @@ from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
+# Fields checked, in order, for the document body (the title is handled separately)
+CONTENT_FIELDS = ('text', 'content', 'name')
+
+def _encode_json(value: Any) -> str:
+    """
+    Serialize a value as compact JSON. Always uses the standard library, since the
+    output becomes document metadata and must not vary with the installed packages.
+    """
+    return json.dumps(value, default=str, separators=(',', ':'), ensure_ascii=False)
+
 class DocumentGraphReaderProvider(LlamaIndexReaderProviderBase):
     """Reader provider for document-graph data integration."""
 
@@ -13,6 +24,9 @@ class DocumentGraphReaderProvider(LlamaIndexReaderProviderBase):
         """Initialize with DocumentGraphReaderConfig."""
         super().__init__(config=config, reader_cls=None)
         self.metadata_fn = config.metadata_fn or self._default_metadata_fn
+        # The default metadata function only returns string values, so its output needs no coercion
+        self._use_default_metadata = config.metadata_fn is None
+        self._json_encoder = _encode_json if config.metadata_json else None
         logger.debug("Initialized DocumentGraphReaderProvider")
 
     def read(self, input_source: List[Dict[str, Any]]) -> List[Document]:
@@ -46,29 +60,42 @@ class DocumentGraphReaderProvider(LlamaIndexReaderProviderBase):
 
     def _extract_text_content(self, doc_data: Dict[str, Any]) -> str:
         """Extract text content from document data."""
-        content_fields = ['text', 'content', 'title', 'name']
-        text_parts = []
+        title = doc_data.get('title')
         
-        if 'title' in doc_data and doc_data['title']:
-            text_parts.append(f"Title: {doc_data['title']}")
-        
-        for field in content_fields:
-            if field in doc_data and doc_data[field] and field != 'title':
-                text_parts.append(str(doc_data[field]))
+        content = None
+        for field in CONTENT_FIELDS:
+            content = doc_data.get(field)
+            if content:
                 break
         
-        return '\n'.join(text_parts) if text_parts else str(doc_data)
+        if title:
+            return f"Title: {title}\n{content}" if content else f"Title: {title}"
+        return str(content) if content else str(doc_data)
 
     def _default_metadata_fn(self, doc_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Default metadata function."""
+        """Default metadata function. Returns string values only, so its output is used without further coercion."""
+        get = doc_data.get
+        fallback_id = get('id', 'unknown')
         return {
             'data_source': 'document_graph',
-            'document_id': str(doc_data.get('document_id', doc_data.get('id', 'unknown'))),
-            'node_id': str(doc_data.get('node_id', doc_data.get('id', 'unknown'))),
-            'source_type': str(doc_data.get('source_type', 'unknown'))
+            'document_id': str(get('document_id', fallback_id)),
+            'node_id': str(get('node_id', fallback_id)),
+            'source_type': str(get('source_type', 'unknown'))
         }
 
     def _generate_metadata(self, doc_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate metadata using configured metadata function."""
+        if self._use_default_metadata:
+            return self._default_metadata_fn(doc_data)
         metadata = self.metadata_fn(doc_data)
-        return {k: str(v) if v is not None else "" for k, v in metadata.items()}
\ No newline at end of file
+        if self._json_encoder is not None:
+            return {k: self._to_json_metadata_value(v) for k, v in metadata.items()}
+        return {k: str(v) if v is not None else "" for k, v in metadata.items()}
+
+    def _to_json_metadata_value(self, value: Any) -> str:
+        """Coerce a metadata value to a string, serializing structured values as JSON."""
+        if value is None:
+            return ""
+        if isinstance(value, (dict, list, tuple)):
+            return self._json_encoder(value)
+        return str(value)
\ No newline at end of file
@@ -30,19 +30,14 @@ class DocxReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
             logger.error("No input source provided to DocxReaderProvider")
             raise ValueError("input_source cannot be None or empty")
         
-        logger.info(f"Reading DOCX from: {input_source}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Reading DOCX from: {input_source}")
         processed_paths, temp_files, original_paths = self._process_file_paths(input_source)
         
         try:
-            documents = self._reader.load_data(file=processed_paths[0])
+            documents = self._load_files(lambda path: self._reader.load_data(file=path), processed_paths, original_paths)
             logger.info(f"Successfully read {len(documents)} document(s) from DOCX")
             
-            if self.metadata_fn:
-                for doc in documents:
-                    additional_metadata = self.metadata_fn(original_paths[0])
-                    doc.metadata.update(additional_metadata)
-                    doc.metadata['source'] = self._get_file_source_type(original_paths[0])
-            
             return documents
         except Exception as e:
             logger.error(f"Failed to read DOCX from {input_source}: {e}", exc_info=True)
@@ -51,7 +51,8 @@ class GitHubReaderProvider:
                 owner=owner,
                 repo=repo,
                 github_client=github_client,
-                verbose=self.github_config.verbose
+                verbose=self.github_config.verbose,
+                concurrent_requests=self.github_config.concurrent_requests
             )
 
             documents = reader.load_data(branch=branch)
@@ -7,6 +7,9 @@ from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
+# JSONReader arguments that are passed through only when the config defines and sets them
+OPTIONAL_READER_ARGS = ('levels_back', 'collapse_length', 'ensure_ascii')
+
 class JSONReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
     """Reader provider for JSON files with S3 support using LlamaIndex's JSONReader."""
 
@@ -24,13 +27,10 @@ class JSONReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
             "is_jsonl": config.is_jsonl,
             "clean_json": config.clean_json
         }
-        
-        if hasattr(config, 'levels_back') and config.levels_back is not None:
-            reader_kwargs["levels_back"] = config.levels_back
-        if hasattr(config, 'collapse_length') and config.collapse_length is not None:
-            reader_kwargs["collapse_length"] = config.collapse_length
-        if hasattr(config, 'ensure_ascii'):
-            reader_kwargs["ensure_ascii"] = config.ensure_ascii
+        reader_kwargs.update(
+            (arg, value) for arg in OPTIONAL_READER_ARGS
+            if (value := getattr(config, arg, None)) is not None
+        )
         
         super().__init__(config=config, reader_cls=JSONReader, **reader_kwargs)
         self.metadata_fn = config.metadata_fn
@@ -42,19 +42,14 @@ class JSONReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
             logger.error("No input source provided to JSONReaderProvider")
             raise ValueError("input_source cannot be None or empty")
         
-        logger.info(f"Reading JSON from: {input_source}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Reading JSON from: {input_source}")
         processed_paths, temp_files, original_paths = self._process_file_paths(input_source)
         
         try:
-            documents = self._reader.load_data(input_file=processed_paths[0])
+            documents = self._load_files(lambda path: self._reader.load_data(input_file=path), processed_paths, original_paths)
             logger.info(f"Successfully read {len(documents)} document(s) from JSON")
             
-            if self.metadata_fn:
-                for doc in documents:
-                    additional_metadata = self.metadata_fn(original_paths[0])
-                    doc.metadata.update(additional_metadata)
-                    doc.metadata['source'] = self._get_file_source_type(original_paths[0])
-            
             return documents
         except Exception as e:
             logger.error(f"Failed to read JSON from {input_source}: {e}", exc_info=True)
@@ -7,6 +7,10 @@ from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
+# With stream_s3, S3 PDFs up to this size are parsed from memory; larger ones are
+# downloaded to a temp file, so memory use doesn't grow with the object size
+STREAM_S3_MAX_BYTES = 32 * 1024 * 1024
+
 class PDFReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
     """Reader provider for PDF files with S3 support using LlamaIndex's PyMuPDFReader."""
 
@@ -22,8 +26,54 @@ class PDFReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
 
         super().__init__(config=config, reader_cls=PyMuPDFReader)
         self.return_full_document = config.return_full_document
+        self.stream_s3 = config.stream_s3 and not config.return_full_document
         self.metadata_fn = config.metadata_fn
-        logger.debug(f"Initialized PDFReaderProvider with return_full_document={config.return_full_document}")
+        logger.debug(f"Initialized PDFReaderProvider with return_full_document={config.return_full_document}, stream_s3={self.stream_s3}")
+
+    def _load_s3_pdf(self, s3_path: str) -> List[Document]:
+        """
+        Parse an S3 PDF, producing the same per-page documents as PyMuPDFReader, with
+        file_path set to the S3 path. PDFs up to STREAM_S3_MAX_BYTES are parsed from
+        memory; larger ones from a temp file.
+        """
+        import fitz
+
+        pdf_bytes = self._read_s3_file(s3_path, STREAM_S3_MAX_BYTES)
+        if pdf_bytes is not None:
+            with fitz.open(stream=pdf_bytes, filetype='pdf') as doc:
+                return self._get_page_documents(doc, s3_path)
+
+        temp_path = self._download_s3_file(s3_path)
+        try:
+            with fitz.open(temp_path) as doc:
+                return self._get_page_documents(doc, s3_path)
+        finally:
+            self._cleanup_temp_files([temp_path])
+
+    @staticmethod
+    def _get_page_documents(doc, file_path: str) -> List[Document]:
+        extra_info = {'total_pages': len(doc), 'file_path': file_path}
+        return [
+            Document(
+                text=page.get_text(),
+                extra_info=dict(extra_info, source=f"{page.number + 1}")
+            )
+            for page in doc
+        ]
+
+    def _load_pdf(self, file_path: str) -> List[Document]:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Processing PDF file: {file_path}")
+        if self.stream_s3 and self._is_s3_path(file_path):
+            return self._load_s3_pdf(file_path)
+        if self.return_full_document:
+            return self._reader.load_data(file_path=file_path, return_full_document=True)
+        return self._reader.load_data(file_path=file_path)
+
+    def read_many(self, input_sources) -> List[Document]:
+        """Read a batch of PDF sources in a single read() pass."""
+        paths = self._flatten_paths(input_sources)
+        return self.read(paths) if paths else []
 
     def read(self, input_source) -> List[Document]:
         """Read PDF documents from local files or S3 with metadata handling."""
@@ -31,24 +81,21 @@ class PDFReaderProvider(LlamaIndexReaderProviderBase, S3FileMixin):
             logger.error("No input source provided to PDFReaderProvider")
             raise ValueError("input_source cannot be None or empty")
         
-        logger.info(f"Reading PDF from: {input_source}")
-        processed_paths, temp_files, original_paths = self._process_file_paths(input_source)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Reading PDF from: {input_source}")
+        if self.stream_s3:
+            # S3 files are fetched by _load_pdf, so only local paths need checking
+            original_paths = [input_source] if isinstance(input_source, str) else list(input_source)
+            _, temp_files, _ = self._process_file_paths([path for path in original_paths if not self._is_s3_path(path)])
+            processed_paths = original_paths
+        else:
+            processed_paths, temp_files, original_paths = self._process_file_paths(input_source)
         
         try:
-            logger.debug(f"Processing PDF file: {processed_paths[0]}")
-            if self.return_full_document:
-                documents = self._reader.load_data(file_path=processed_paths[0], return_full_document=True)
-            else:
-                documents = self._reader.load_data(file_path=processed_paths[0])
+            documents = self._load_files(self._load_pdf, processed_paths, original_paths)
             
             logger.info(f"Successfully read {len(documents)} document(s) from PDF")
             
-            if self.metadata_fn:
-                for doc in documents:
-                    additional_metadata = self.metadata_fn(original_paths[0])
-                    doc.metadata.update(additional_metadata)
-                    doc.metadata['source'] = self._get_file_source_type(original_paths[0])
-            
             return documents
         except Exception as e:
             logger.error(f"Failed to read PDF from {input_source}: {e}", exc_info=True)
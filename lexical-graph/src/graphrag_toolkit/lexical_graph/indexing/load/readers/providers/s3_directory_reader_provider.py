@@ -59,8 +59,8 @@ class S3DirectoryReaderProvider(LlamaIndexReaderProviderBase):
             logger.info(f"Successfully read {len(documents)} document(s) from S3")
 
             if self.metadata_fn:
+                additional_metadata = self.metadata_fn(s3_path)
                 for doc in documents:
-                    additional_metadata = self.metadata_fn(s3_path)
                     doc.metadata.update(additional_metadata)
 
             return documents
@@ -1,4 +1,6 @@
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Union
 from llama_index.core.schema import Document
 from ..reader_provider_config import StructuredDataReaderConfig
 from ..base_reader_provider import BaseReaderProvider
@@ -7,10 +9,183 @@ from graphrag_toolkit.lexical_graph.logging import logging
 
 logger = logging.getLogger(__name__)
 
+# 'pandas' parses every file with pandas; 'arrow' parses local CSV and JSONL files with
+# pyarrow and joins the selected columns without building a DataFrame. Excel, JSON
+# array files, streamed S3 files, and pandas_config options other than a single-character
+# separator are always parsed by pandas, but with 'arrow' their selected columns are
+# still cast and joined by pyarrow. Arrow formats some values differently from pandas
+# (whole floats as '2' rather than '2.0', booleans as 'true' rather than 'True'), so
+# the two backends can produce different document text, and therefore different
+# source and chunk IDs, for the same file.
+BACKEND_PANDAS = 'pandas'
+BACKEND_ARROW = 'arrow'
+BACKENDS = [BACKEND_PANDAS, BACKEND_ARROW]
+ARROW_FILE_TYPES = ('csv', 'jsonl')
+ARROW_PANDAS_CONFIG_KEYS = {'sep', 'delimiter', 'lines'}
+
+FILE_TYPES_BY_EXTENSION = {
+    'csv': 'csv',
+    'xlsx': 'excel',
+    'xls': 'excel',
+    'json': 'json',
+    'jsonl': 'jsonl'
+}
+
+# File types whose pandas readers accept usecols, so the column selection can be pushed into
+# the parser; pandas_config options that change column positions disable the push-down
+PROJECTED_FILE_TYPES = ('csv', 'excel')
+PROJECTION_BLOCKING_KEYS = {'usecols', 'index_col'}
+
+# File types pandas can parse in chunks of rows
+CHUNKED_FILE_TYPES = ('csv', 'jsonl')
+
+# read_csv engines that accept memory_map (the pyarrow engine rejects it)
+MEMORY_MAP_ENGINES = (None, 'c', 'python')
+
+def _get_csv_delimiter(pandas_config: dict):
+    return pandas_config.get('sep', pandas_config.get('delimiter', ','))
+
+def _can_parse_with_arrow(file_type: str, pandas_config: dict) -> bool:
+    """
+    Whether pyarrow can parse a file with these pandas_config options. Arrow's CSV parser
+    only takes a single-character delimiter, so regex and multi-character separators
+    (and sep=None sniffing) are left to pandas.
+    """
+    if file_type not in ARROW_FILE_TYPES or not set(pandas_config).issubset(ARROW_PANDAS_CONFIG_KEYS):
+        return False
+    if file_type == 'csv':
+        delimiter = _get_csv_delimiter(pandas_config)
+        return isinstance(delimiter, str) and len(delimiter) == 1
+    return True
+
+def _read_text_list_with_arrow(file_path: str, file_type: str, col_index, col_joiner: str, pandas_config: dict) -> List[str]:
+    """Parse a CSV or JSONL file with pyarrow and build one text per row from the selected columns."""
+    import pyarrow as pa
+
+    if file_type == 'csv':
+        from pyarrow import csv
+        delimiter = _get_csv_delimiter(pandas_config)
+        # Local files are memory-mapped, so the parser reads straight from the page cache
+        with pa.memory_map(file_path) as source:
+            table = csv.read_csv(
+                source,
+                read_options=csv.ReadOptions(use_threads=True),
+                parse_options=csv.ParseOptions(delimiter=delimiter),
+                # Empty cells are read as nulls, which are rendered as 'nan' like pandas renders missing values
+                convert_options=csv.ConvertOptions(strings_can_be_null=True)
+            )
+    else:
+        from pyarrow import json
+        with pa.memory_map(file_path) as source:
+            table = json.read_json(source, read_options=json.ReadOptions(use_threads=True))
+
+    if isinstance(col_index, list):
+        columns = [table.column(col) for col in col_index]
+    else:
+        columns = [table.column(col_index)]
+
+    return _join_arrow_columns(columns, col_joiner)
+
+def _join_arrow_columns(columns: list, col_joiner: str) -> List[str]:
+    """
+    Cast pyarrow columns to strings (nulls as 'nan') and join them row by row. Values are
+    formatted by arrow, which differs from pandas for floats and booleans.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = [pc.fill_null(pc.cast(column, pa.string()), 'nan') for column in columns]
+    if len(columns) == 1:
+        return columns[0].to_pylist()
+    return pc.binary_join_element_wise(*columns, col_joiner).to_pylist()
+
+def _join_columns_with_arrow(df_text, col_joiner: str) -> Optional[List[str]]:
+    """
+    Convert the selected DataFrame columns to pyarrow and cast and join them there, avoiding
+    a Python str() call per cell. Values are formatted by arrow rather than pandas, so
+    files that pandas parses still get the arrow backend's text. Returns None if a column
+    can't be converted (e.g. an object column mixing strings and numbers), so the caller
+    can fall back to pandas.
+    """
+    import pyarrow as pa
+
+    series = [df_text.iloc[:, i] for i in range(df_text.shape[1])] if df_text.ndim == 2 else [df_text]
+    try:
+        columns = [pa.array(column, from_pandas=True) for column in series]
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+    return _join_arrow_columns(columns, col_joiner)
+
+def _project_columns(col_index, pandas_config: dict) -> tuple:
+    """
+    Push the col_index selection into the pandas parser with usecols, so that unselected
+    columns are never tokenized or type-converted.
+
+    Returns the updated pandas_config and the col_index to apply to the projected
+    DataFrame: labels are unchanged, positions are remapped onto the projected
+    columns (usecols keeps the file's column order). The inputs are returned unchanged
+    when the selection can't be pushed down.
+    """
+    if PROJECTION_BLOCKING_KEYS.intersection(pandas_config):
+        return pandas_config, col_index
+
+    selected = col_index if isinstance(col_index, list) else [col_index]
+    if not selected:
+        return pandas_config, col_index
+
+    if all(isinstance(item, int) and not isinstance(item, bool) and item >= 0 for item in selected):
+        if pandas_config.get('engine') == 'pyarrow':
+            # The pyarrow engine only accepts column names in usecols
+            return pandas_config, col_index
+        usecols = sorted(set(selected))
+        projected_positions = {position: i for i, position in enumerate(usecols)}
+        if isinstance(col_index, list):
+            col_index = [projected_positions[item] for item in col_index]
+        else:
+            col_index = projected_positions[col_index]
+    elif all(isinstance(item, str) for item in selected):
+        usecols = list(dict.fromkeys(selected))
+    else:
+        return pandas_config, col_index
+
+    return {**pandas_config, 'usecols': usecols}, col_index
+
+def _join_columns(df_text, col_joiner: str) -> List[str]:
+    """Join the selected DataFrame columns row by row into one string per row.
+
+    When every column shares a dtype, a row holds the same values as the columns,
+    so each column is stringified once and the rows are joined with ``zip``,
+    instead of building a Series per row with ``DataFrame.apply(axis=1)``. Mixed
+    and datetime dtypes keep the row-wise path, where pandas upcasts each row to
+    a common dtype before stringifying it.
+    """
+    dtypes = set(df_text.dtypes)
+    if df_text.shape[1] > 0 and len(dtypes) == 1 and next(iter(dtypes)).kind not in 'mM':
+        columns = [df_text.iloc[:, i].astype(str).tolist() for i in range(df_text.shape[1])]
+        return [col_joiner.join(values) for values in zip(*columns)]
+    return df_text.apply(
+        lambda row: col_joiner.join(row.astype(str).tolist()), axis=1
+    ).tolist()
+
+
 class StructuredDataReaderProvider(BaseReaderProvider, S3FileMixin):
     """Provider for structured data files (CSV, Excel, etc.) with S3 support."""
 
     def __init__(self, config: StructuredDataReaderConfig):
+        try:
+            import pandas as pd
+        except ImportError as e:
+            logger.error("Failed to import pandas")
+            raise ImportError("StructuredDataReaderProvider requires 'pandas'. Install with: pip install pandas") from e
+        if config.backend not in BACKENDS:
+            raise ValueError(f"Unsupported backend: '{config.backend}'. Supported backends: {BACKENDS}")
+        if config.backend == BACKEND_ARROW:
+            try:
+                import pyarrow
+            except ImportError as e:
+                logger.error("Failed to import pyarrow for the arrow backend")
+                raise ImportError("The arrow backend requires 'pyarrow'. Install with: pip install pyarrow") from e
+        self._pd = pd
         self.config = config
         self.metadata_fn = config.metadata_fn
         logger.debug("Initialized StructuredDataReaderProvider")
@@ -21,106 +196,148 @@ class StructuredDataReaderProvider(BaseReaderProvider, S3FileMixin):
             logger.error("No input source provided to StructuredDataReaderProvider")
             raise ValueError("input_source cannot be None or empty")
         
-        try:
-            import pandas as pd
-        except ImportError as e:
-            logger.error("Failed to import pandas")
-            raise ImportError("StructuredDataReaderProvider requires 'pandas'. Install with: pip install pandas") from e
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Reading structured data from: {input_source}")
+        input_paths = [input_source] if isinstance(input_source, str) else list(input_source)
         
-        from pathlib import Path
-        logger.info(f"Reading structured data from: {input_source}")
-        processed_paths, temp_files, original_paths = self._process_file_paths(input_source)
+        # Decide up front which S3 files will be streamed from a presigned URL, so that they
+        # are not also downloaded to a temp file; only the remaining files are downloaded
+        streamed_paths = {
+            path for path in input_paths
+            if self._is_s3_path(path) and self._should_stream_s3_file(path, self.config.stream_s3, self.config.stream_threshold_mb)
+        }
+        processed_paths, temp_files, original_paths = self._process_file_paths(
+            [path for path in input_paths if path not in streamed_paths]
+        )
+        processed_by_original = dict(zip(original_paths, processed_paths))
         documents = []
         
         try:
-            for processed_path, original_path in zip(processed_paths, original_paths):
-                try:
-                    if original_path.lower().endswith('.csv'):
-                        file_type = 'csv'
-                        pandas_config = self.config.pandas_config or {}
-                    elif original_path.lower().endswith(('.xlsx', '.xls')):
-                        file_type = 'excel'
-                        pandas_config = {k: v for k, v in (self.config.pandas_config or {}).items() 
-                                       if k not in ['sep', 'delimiter']}
-                    elif original_path.lower().endswith('.json'):
-                        file_type = 'json'
-                        pandas_config = {k: v for k, v in (self.config.pandas_config or {}).items() 
-                                       if k not in ['sep', 'delimiter']}
-                    elif original_path.lower().endswith('.jsonl'):
-                        file_type = 'jsonl'
-                        pandas_config = {k: v for k, v in (self.config.pandas_config or {}).items() 
-                                       if k not in ['sep', 'delimiter']}
-                        pandas_config['lines'] = True
-                    else:
-                        logger.error(f"Unsupported file type: {original_path}")
-                        raise ValueError(f"Unsupported file type: {original_path}")
-
-                    logger.debug(f"Processing {file_type} file: {original_path}")
-                    
-                    if (self._is_s3_path(original_path) and 
-                        self._should_stream_s3_file(original_path, self.config.stream_s3, self.config.stream_threshold_mb)):
-                        stream_url = self._get_s3_stream_url(original_path)
-                        logger.debug(f"Streaming large S3 file from presigned URL")
-                        
-                        if file_type == 'csv':
-                            df = pd.read_csv(stream_url, **pandas_config)
-                        elif file_type == 'excel':
-                            df = pd.read_excel(stream_url, **pandas_config)
-                        elif file_type in ['json', 'jsonl']:
-                            df = pd.read_json(stream_url, encoding='utf-8', **pandas_config)
-                    else:
-                        file_path = Path(processed_path)
-                        
-                        if file_type == 'csv':
-                            df = pd.read_csv(file_path, **pandas_config)
-                        elif file_type == 'excel':
-                            df = pd.read_excel(file_path, **pandas_config)
-                        elif file_type in ['json', 'jsonl']:
-                            df = pd.read_json(file_path, encoding='utf-8', **pandas_config)
-
-                    if isinstance(self.config.col_index, int):
-                        df_text = df.iloc[:, self.config.col_index]
-                    elif isinstance(self.config.col_index, list):
-                        if all(isinstance(item, int) for item in self.config.col_index):
-                            df_text = df.iloc[:, self.config.col_index]
-                        else:
-                            df_text = df[self.config.col_index]
-                    else:
-                        df_text = df[self.config.col_index]
-
-                    if isinstance(df_text, pd.DataFrame):
-                        text_list = df_text.apply(
-                            lambda row: self.config.col_joiner.join(row.astype(str).tolist()), axis=1
-                        ).tolist()
-                    elif isinstance(df_text, pd.Series):
-                        text_list = df_text.astype(str).tolist()
-
-                    docs = [Document(text=text) for text in text_list]
-
-                    for doc in docs:
-                        metadata = {
-                            'file_path': original_path,
-                            'file_type': file_type,
-                            'source': self._get_file_source_type(original_path),
-                            'document_type': 'structured_data',
-                            'content_category': 'tabular_data'
-                        }
-                        
-                        if self.metadata_fn:
-                            custom_metadata = self.metadata_fn(original_path)
-                            metadata.update(custom_metadata)
-                        
-                        doc.metadata.update(metadata)
-                    
-                    documents.extend(docs)
-                    logger.info(f"Successfully processed {len(docs)} document(s) from {file_type} file")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process file {original_path}: {e}", exc_info=True)
-                    continue
+            file_paths = [processed_by_original.get(path) for path in input_paths]
+            stream_flags = [path in streamed_paths for path in input_paths]
+            num_workers = min(self.config.max_workers or 1, len(input_paths))
+            if num_workers <= 1:
+                results = list(map(self._read_file, file_paths, input_paths, stream_flags))
+            else:
+                # Files are independent and reads mostly block on disk or network I/O (pandas releases
+                # the GIL while parsing), so with max_workers set they run on a thread pool; map() keeps
+                # input order and re-raises the first failure
+                with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                    results = list(executor.map(self._read_file, file_paths, input_paths, stream_flags))
+            for docs in results:
+                documents.extend(docs)
         
         finally:
             self._cleanup_temp_files(temp_files)
         
         logger.info(f"Total documents read: {len(documents)}")
-        return documents
\ No newline at end of file
+        return documents
+
+    def read_many(self, input_sources: List[Union[str, List[str]]]) -> List[Document]:
+        """Read a batch of structured data sources in a single read() pass, sharing one thread pool."""
+        paths = self._flatten_paths(input_sources)
+        return self.read(paths) if paths else []
+
+    def _get_text_list(self, df, col_index) -> List[str]:
+        """Build one text per DataFrame row from the columns selected by col_index."""
+        pd = self._pd
+        if isinstance(col_index, int):
+            df_text = df.iloc[:, col_index]
+        elif isinstance(col_index, list):
+            if all(isinstance(item, int) for item in col_index):
+                df_text = df.iloc[:, col_index]
+            else:
+                df_text = df[col_index]
+        else:
+            df_text = df[col_index]
+
+        if self.config.backend == BACKEND_ARROW:
+            text_list = _join_columns_with_arrow(df_text, self.config.col_joiner)
+            if text_list is not None:
+                return text_list
+
+        if isinstance(df_text, pd.DataFrame):
+            return _join_columns(df_text, self.config.col_joiner)
+        return df_text.astype(str).tolist()
+
+    def _read_file(self, processed_path: Optional[str], original_path: str, stream: bool) -> List[Document]:
+        """
+        Read a single structured data file, either from its processed (local) path or, if
+        stream is set, from a presigned URL for the S3 object. Failures are raised, or
+        logged and yield no documents if skip_failed_files is set.
+        """
+        pd = self._pd
+        try:
+            _, dot, extension = original_path.lower().rpartition('.')
+            file_type = FILE_TYPES_BY_EXTENSION.get(extension) if dot else None
+            if file_type is None:
+                logger.error(f"Unsupported file type: {original_path}")
+                raise ValueError(f"Unsupported file type: {original_path}")
+
+            pandas_config = dict(self.config.pandas_config or {})
+            if file_type != 'csv':
+                pandas_config.pop('sep', None)
+                pandas_config.pop('delimiter', None)
+            if file_type == 'jsonl':
+                pandas_config['lines'] = True
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Processing {file_type} file: {original_path}")
+            
+            col_index = self.config.col_index
+            use_arrow = not stream and self.config.backend == BACKEND_ARROW and _can_parse_with_arrow(file_type, pandas_config)
+            if not use_arrow and file_type in PROJECTED_FILE_TYPES:
+                pandas_config, col_index = _project_columns(col_index, pandas_config)
+            
+            if use_arrow:
+                text_list = _read_text_list_with_arrow(processed_path, file_type, col_index, self.config.col_joiner, pandas_config)
+            else:
+                if stream:
+                    source = self._get_s3_stream_url(original_path)
+                    logger.debug("Streaming large S3 file from presigned URL")
+                else:
+                    source = Path(processed_path)
+                    if file_type == 'csv' and pandas_config.get('engine') in MEMORY_MAP_ENGINES:
+                        # Memory-map local files unless pandas_config says otherwise
+                        pandas_config = {'memory_map': True, **pandas_config}
+                
+                if self.config.chunk_size and file_type in CHUNKED_FILE_TYPES:
+                    pandas_config = {'chunksize': self.config.chunk_size, **pandas_config}
+                
+                if file_type == 'csv':
+                    df = pd.read_csv(source, **pandas_config)
+                elif file_type == 'excel':
+                    df = pd.read_excel(source, **pandas_config)
+                elif file_type in ['json', 'jsonl']:
+                    df = pd.read_json(source, encoding='utf-8', **pandas_config)
+                
+                if pandas_config.get('chunksize'):
+                    # Only one chunk of rows is held as a DataFrame at a time
+                    with df as chunks:
+                        text_list = [text for chunk in chunks for text in self._get_text_list(chunk, col_index)]
+                else:
+                    text_list = self._get_text_list(df, col_index)
+
+            # Every row shares the file's metadata, so build it (and call metadata_fn) once per file
+            metadata = {
+                'file_path': original_path,
+                'file_type': file_type,
+                'source': self._get_file_source_type(original_path),
+                'document_type': 'structured_data',
+                'content_category': 'tabular_data'
+            }
+            
+            if self.metadata_fn:
+                custom_metadata = self.metadata_fn(original_path)
+                metadata.update(custom_metadata)
+            
+            docs = [Document(text=text, metadata=dict(metadata)) for text in text_list]
+            
+            logger.info(f"Successfully processed {len(docs)} document(s) from {file_type} file")
+            return docs
+            
+        except Exception as e:
+            logger.error(f"Failed to process file {original_path}: {e}", exc_info=True)
+            if not self.config.skip_failed_files:
+                raise
+            return []
\ No newline at end of file
@@ -1,4 +1,6 @@
-from typing import List, Optional, Dict, Any, Union
+import queue
+import threading
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Union
 from graphrag_toolkit.lexical_graph.indexing.load.readers.llama_index_reader_provider_base import LlamaIndexReaderProviderBase
 from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config_base import ReaderProviderConfig
 from graphrag_toolkit.lexical_graph.logging import logging
@@ -6,6 +8,48 @@ from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
+# Number of source documents downloaded ahead of the one being converted
+PREFETCH_SIZE = 4
+
+def _prefetch(items: Iterable, size: int = PREFETCH_SIZE) -> Iterator:
+    """
+    Iterate over items on a background thread, keeping up to size items ready, so that
+    producing the next item (e.g. downloading it) overlaps with consuming the current one.
+    Errors raised while producing are re-raised in the consumer.
+    """
+    buffer = queue.Queue(maxsize=size)
+    stopped = threading.Event()
+    end = object()
+
+    def produce():
+        try:
+            for item in items:
+                buffer.put((item, None))
+                if stopped.is_set():
+                    return
+            buffer.put((end, None))
+        except Exception as e:
+            buffer.put((end, e))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is end:
+                return
+            yield item
+    finally:
+        # Unblock the producer if the consumer stopped early
+        stopped.set()
+        while thread.is_alive():
+            try:
+                buffer.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
 
 class UniversalDirectoryReaderConfig(ReaderProviderConfig):
     """Config for UniversalDirectoryReaderProvider."""
@@ -76,8 +120,8 @@ class UniversalDirectoryReaderProvider(LlamaIndexReaderProviderBase):
             logger.info(f"Successfully read {len(documents)} document(s) from local")
             
             if self.metadata_fn:
+                additional_metadata = self.metadata_fn(input_dir or self.config.input_files)
                 for doc in documents:
-                    additional_metadata = self.metadata_fn(input_dir or self.config.input_files)
                     doc.metadata.update(additional_metadata)
             
             return documents
@@ -113,14 +157,14 @@ class UniversalDirectoryReaderProvider(LlamaIndexReaderProviderBase):
                 collection_id=collection_id
             )
             
-            documents = []
-            for source_doc in s3_docs:
-                for node in source_doc.nodes:
-                    doc = Document(text=node.text, metadata=node.metadata)
-                    if self.metadata_fn:
-                        additional_metadata = self.metadata_fn(f"s3://{bucket_name}/{key_prefix}/{collection_id}")
-                        doc.metadata.update(additional_metadata)
-                    documents.append(doc)
+            additional_metadata = self.metadata_fn(f"s3://{bucket_name}/{key_prefix}/{collection_id}") if self.metadata_fn else {}
+            
+            # The next source documents are downloaded while the current one is converted
+            documents = [
+                Document(text=node.text, metadata={**node.metadata, **additional_metadata})
+                for source_doc in _prefetch(s3_docs)
+                for node in source_doc.nodes
+            ]
             
             logger.info(f"Successfully read {len(documents)} document(s) from S3")
             return documents
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from graphrag_toolkit.lexical_graph.indexing.load.readers.llama_index_reader_provider_base import LlamaIndexReaderProviderBase
 from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import WebReaderConfig
@@ -6,6 +7,9 @@ from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent page fetches when WebReaderConfig.max_workers is not set
+MAX_WORKERS = 8
+
 class WebReaderProvider(LlamaIndexReaderProviderBase):
     """Reader provider for web pages using LlamaIndex's SimpleWebPageReader."""
 
@@ -22,8 +26,12 @@ class WebReaderProvider(LlamaIndexReaderProviderBase):
 
         reader_kwargs = {"html_to_text": config.html_to_text}
         super().__init__(config=config, reader_cls=SimpleWebPageReader, **reader_kwargs)
+        self.max_workers = config.max_workers
         logger.debug(f"Initialized WebReaderProvider with html_to_text={config.html_to_text}")
 
+    def _load_url(self, url: str) -> List[Document]:
+        return self._reader.load_data(urls=[url])
+
     def read(self, input_source) -> List[Document]:
         """Read web page documents with proper parameter handling."""
         if not input_source:
@@ -34,7 +42,14 @@ class WebReaderProvider(LlamaIndexReaderProviderBase):
         logger.info(f"Reading {len(urls)} web page(s)")
         
         try:
-            docs = self._reader.load_data(urls=urls)
+            max_workers = min(self.max_workers or MAX_WORKERS, len(urls))
+            if max_workers > 1:
+                # SimpleWebPageReader fetches URLs one after another; fetching them from
+                # a thread pool overlaps the network waits, and map() preserves URL order
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    docs = [doc for url_docs in executor.map(self._load_url, urls) for doc in url_docs]
+            else:
+                docs = self._reader.load_data(urls=urls)
             logger.info(f"Successfully read {len(docs)} document(s) from {len(urls)} URL(s)")
             return docs
         except Exception as e:
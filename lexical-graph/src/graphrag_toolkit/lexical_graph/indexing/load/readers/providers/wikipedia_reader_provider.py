@@ -1,10 +1,92 @@
-from typing import List, Union
+import importlib
+import threading
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple, Union
 from llama_index.core.schema import Document
 from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import WikipediaReaderConfig
 from graphrag_toolkit.lexical_graph.logging import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent page loads when WikipediaReaderConfig.max_workers is not set
+MAX_WORKERS = 8
+
+# API URL the wikipedia package uses once set_lang has been called for a language
+WIKIPEDIA_API_URL = 'http://{lang}.wikipedia.org/w/api.php'
+
+# Maximum number of titles MediaWiki accepts in a single query request
+MAX_TITLES_PER_QUERY = 50
+
+_session_lock = threading.Lock()
+_session_users = 0
+_original_requests = None
+
+class _PooledRequests:
+    """
+    Stand-in for the requests module inside the wikipedia package.
+
+    The wikipedia package calls requests.get() for every API request, which opens
+    a new connection (and TLS handshake) each time. This gives each thread its own
+    keep-alive session instead, since requests.Session is not guaranteed to be
+    thread-safe, so a worker reuses its connection across the pages it loads.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._sessions = []
+
+    def get(self, *args, **kwargs):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._local.session = session
+            with _session_lock:
+                self._sessions.append(session)
+        return session.get(*args, **kwargs)
+
+    def close(self):
+        for session in self._sessions:
+            session.close()
+
+@contextmanager
+def _pooled_requests():
+    """
+    Route the wikipedia package's API calls through _PooledRequests for the duration
+    of the block.
+
+    The package's module-level requests reference is swapped on entry and restored
+    when the last concurrent reader exits, so any other use of the wikipedia package
+    in the process shares the pooled connections only while a read is in progress.
+    """
+    global _session_users, _original_requests
+    wikipedia_api = importlib.import_module('wikipedia.wikipedia')
+    with _session_lock:
+        if _session_users == 0:
+            _original_requests = wikipedia_api.requests
+            wikipedia_api.requests = _PooledRequests()
+        _session_users += 1
+    try:
+        yield
+    finally:
+        with _session_lock:
+            _session_users -= 1
+            if _session_users == 0:
+                pooled_requests, wikipedia_api.requests = wikipedia_api.requests, _original_requests
+                _original_requests = None
+            else:
+                pooled_requests = None
+        if pooled_requests is not None:
+            pooled_requests.close()
+
 class WikipediaReaderProvider:
     """Reader provider for Wikipedia articles using LlamaIndex's WikipediaReader."""
 
@@ -12,6 +94,9 @@ class WikipediaReaderProvider:
         self.config = config
         self.lang = config.lang
         self.metadata_fn = config.metadata_fn
+        self.max_workers = config.max_workers
+        self.pooled_session = config.pooled_session
+        self.batch_lookup = config.batch_lookup
         self._reader = None
         logger.debug(f"Initialized WikipediaReaderProvider with lang={config.lang}")
 
@@ -27,6 +112,87 @@ class WikipediaReaderProvider:
                 ) from e
             self._reader = WikipediaReader()
 
+    def _resolve_pages(self, pages: List[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        Look up titles MAX_TITLES_PER_QUERY at a time, with a single MediaWiki query each.
+
+        Follows normalization and redirects, and returns the page ID and URL for each
+        title that resolves to an existing, non-disambiguation article. Titles that are
+        missing, invalid or ambiguous, or whose batch fails, are left to _load_page.
+        """
+        wikipedia_api = importlib.import_module('wikipedia.wikipedia')
+        resolved_pages = {}
+        unique_pages = list(dict.fromkeys(pages))
+        for i in range(0, len(unique_pages), MAX_TITLES_PER_QUERY):
+            batch = unique_pages[i:i + MAX_TITLES_PER_QUERY]
+            try:
+                query = wikipedia_api._wiki_request({
+                    'prop': 'info|pageprops',
+                    'inprop': 'url',
+                    'ppprop': 'disambiguation',
+                    'redirects': '',
+                    'titles': '|'.join(batch)
+                }).get('query', {})
+            except Exception as e:
+                logger.warning(f"Batched Wikipedia title lookup failed, loading titles individually: {e}")
+                continue
+
+            # Map each requested title to its final title via normalization and redirects
+            targets = {title: title for title in batch}
+            for key in ('normalized', 'redirects'):
+                renames = {item['from']: item['to'] for item in query.get(key, [])}
+                targets = {title: renames.get(target, target) for title, target in targets.items()}
+
+            found = {
+                page['title']: (page_id, page['fullurl'])
+                for page_id, page in query.get('pages', {}).items()
+                if 'missing' not in page and 'invalid' not in page
+                and 'disambiguation' not in page.get('pageprops', {})
+            }
+            resolved_pages.update((title, found[target]) for title, target in targets.items() if target in found)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Batched lookup resolved {len(resolved_pages)} of {len(unique_pages)} Wikipedia page(s)")
+        return resolved_pages
+
+    def _load_page(self, wikipedia, page: str, resolved_page: Optional[Tuple[str, str]] = None) -> Tuple[Optional[str], List[Document]]:
+        """
+        Load a single page, falling back to the top search result if the title is not found.
+
+        A page already resolved by _resolve_pages is fetched by ID with a single
+        extracts query, producing the same document as WikipediaReader. Other pages
+        are loaded directly rather than validated first, so a title that resolves
+        costs one fetch instead of two. Returns the title that was loaded (None if
+        no page is found) together with its documents.
+        """
+        if resolved_page is not None:
+            page_id, url = resolved_page
+            extract = importlib.import_module('wikipedia.wikipedia')._wiki_request({
+                'prop': 'extracts',
+                'explaintext': '',
+                'pageids': page_id
+            })['query']['pages'][page_id]['extract']
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Loaded Wikipedia page: {page}")
+            return page, [Document(id_=page_id, text=extract, metadata={'url': url})]
+
+        try:
+            documents = self._reader.load_data(pages=[page])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Loaded Wikipedia page: {page}")
+            return page, documents
+        except wikipedia.exceptions.PageError:
+            try:
+                if search_results := wikipedia.search(page, results=1):
+                    documents = self._reader.load_data(pages=[search_results[0]])
+                    logger.info(f"Corrected page title: '{page}' -> '{search_results[0]}'")
+                    return search_results[0], documents
+                else:
+                    logger.warning(f"No Wikipedia page found for '{page}'")
+            except (wikipedia.exceptions.PageError, wikipedia.exceptions.DisambiguationError) as e:
+                logger.warning(f"Could not resolve Wikipedia page for '{page}': {e}")
+        return None, []
+
     def read(self, input_source: Union[str, List[str]]) -> List[Document]:
         """Read Wikipedia documents with metadata handling and title correction."""
         if not input_source:
@@ -45,40 +211,39 @@ class WikipediaReaderProvider:
 
         pages = [input_source] if isinstance(input_source, str) else input_source
         logger.info(f"Reading {len(pages)} Wikipedia page(s)")
-        validated_pages = []
-        
-        for page in pages:
-            try:
-                wikipedia.set_lang(self.lang)
-                wikipedia.page(page)
-                validated_pages.append(page)
-                logger.debug(f"Validated Wikipedia page: {page}")
-            except wikipedia.exceptions.PageError:
-                try:
-                    if search_results := wikipedia.search(page, results=1):
-                        wikipedia.page(search_results[0])
-                        validated_pages.append(search_results[0])
-                        logger.info(f"Corrected page title: '{page}' -> '{search_results[0]}'")
-                    else:
-                        logger.warning(f"No Wikipedia page found for '{page}'")
-                except (wikipedia.exceptions.PageError, wikipedia.exceptions.DisambiguationError) as e:
-                    logger.warning(f"Could not resolve Wikipedia page for '{page}': {e}")
-
-        if not validated_pages:
+        # set_lang sets a module-level API URL, so it is set once before loading pages concurrently.
+        # It also clears the package's search and summary caches, so skip it if the language is already set.
+        if importlib.import_module('wikipedia.wikipedia').API_URL != WIKIPEDIA_API_URL.format(lang=self.lang.lower()):
+            wikipedia.set_lang(self.lang)
+
+        # Each page load is a blocking API round-trip; map() keeps page order
+        max_workers = min(self.max_workers or MAX_WORKERS, len(pages))
+        try:
+            with _pooled_requests() if self.pooled_session else nullcontext():
+                resolved_pages = self._resolve_pages(pages) if self.batch_lookup else {}
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = [
+                        result
+                        for result in executor.map(self._load_page, repeat(wikipedia), pages, map(resolved_pages.get, pages))
+                        if result[0] is not None
+                    ]
+        except wikipedia.exceptions.DisambiguationError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to read Wikipedia pages {pages}: {e}", exc_info=True)
+            raise RuntimeError(f"Failed to read Wikipedia pages: {e}") from e
+
+        if not results:
             logger.error(f"No valid Wikipedia pages found for: {pages}")
             raise ValueError(f"No valid Wikipedia pages found for: {pages}")
 
-        try:
-            documents = self._reader.load_data(pages=validated_pages)
-            logger.info(f"Successfully read {len(documents)} document(s) from Wikipedia")
+        loaded_pages = [page for page, _ in results]
+        documents = [doc for _, page_documents in results for doc in page_documents]
+        logger.info(f"Successfully read {len(documents)} document(s) from Wikipedia")
 
-            if self.metadata_fn:
-                for doc in documents:
-                    page_context = validated_pages[0] if validated_pages else str(input_source)
-                    additional_metadata = self.metadata_fn(page_context)
-                    doc.metadata.update(additional_metadata)
+        if self.metadata_fn:
+            additional_metadata = self.metadata_fn(loaded_pages[0])
+            for doc in documents:
+                doc.metadata.update(additional_metadata)
 
-            return documents
-        except Exception as e:
-            logger.error(f"Failed to read Wikipedia pages {validated_pages}: {e}", exc_info=True)
-            raise RuntimeError(f"Failed to read Wikipedia pages: {e}") from e
+        return documents
@@ -1,4 +1,6 @@
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Union
 import re
 from llama_index.core.schema import Document
 from ..reader_provider_config import YouTubeReaderConfig
@@ -6,30 +8,90 @@ from graphrag_toolkit.lexical_graph.logging import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent transcript fetches when YouTubeReaderConfig.max_workers is not set
+MAX_WORKERS = 8
+
+# Matches the ID after 'v=' or '/'; this also covers 'embed/<id>' and 'watch?v=<id>' URLs
+VIDEO_ID_PATTERN = re.compile(r'(?:v=|/)(?P<video_id>[0-9A-Za-z_-]{11})')
+
 class YouTubeReaderProvider:
     """Direct YouTube transcript reader using youtube-transcript-api."""
 
     def __init__(self, config: YouTubeReaderConfig):
         self.language = config.language
         self.metadata_fn = config.metadata_fn
+        self.max_workers = config.max_workers
         logger.debug(f"Initialized YouTubeReaderProvider with language={config.language}")
 
     def _extract_video_id(self, url: str) -> str:
         """Extract video ID from YouTube URL."""
-        patterns = [
-            r'(?:v=|/)([0-9A-Za-z_-]{11}).*',
-            r'(?:embed/)([0-9A-Za-z_-]{11})',
-            r'(?:watch\?v=)([0-9A-Za-z_-]{11})'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
+        match = VIDEO_ID_PATTERN.search(url)
+        if match:
+            return match.group('video_id')
+
         logger.error(f"Could not extract video ID from URL: {url}")
         raise ValueError(f"Could not extract video ID from URL: {url}")
 
+    @staticmethod
+    def _join_transcript(transcript_list) -> str:
+        """Join transcript segments into a single text."""
+        if isinstance(transcript_list, list):
+            # A list comprehension is faster than a generator here: str.join builds a list from a generator anyway
+            return " ".join([segment.get('text', '') for segment in transcript_list])
+        return str(transcript_list)
+
+    def _read_transcript(self, api_cls, url: str) -> Optional[Document]:
+        """Fetch the transcript for a single video, falling back to any language. Returns None on failure."""
+        try:
+            video_id = self._extract_video_id(url)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Processing video ID: {video_id}")
+            
+            api = api_cls()
+            transcript_list = api.fetch(video_id, languages=[self.language])
+            
+            full_text = self._join_transcript(transcript_list)
+            
+            metadata = {
+                'video_id': video_id,
+                'url': url,
+                'language': self.language,
+                'source': 'youtube'
+            }
+            
+            if self.metadata_fn:
+                custom_metadata = self.metadata_fn(url)
+                metadata.update(custom_metadata)
+            
+            logger.info(f"Successfully read transcript for video {video_id}")
+            return Document(text=full_text, metadata=metadata)
+            
+        except Exception as e:
+            logger.warning(f"Failed to read transcript for {url} with language {self.language}: {e}")
+            try:
+                transcript_list = api.fetch(video_id)
+                
+                full_text = self._join_transcript(transcript_list)
+                
+                metadata = {
+                    'video_id': video_id,
+                    'url': url,
+                    'language': 'auto',
+                    'source': 'youtube'
+                }
+                
+                if self.metadata_fn:
+                    custom_metadata = self.metadata_fn(url)
+                    metadata.update(custom_metadata)
+                
+                logger.info(f"Successfully read transcript for video {video_id} with auto language")
+                return Document(text=full_text, metadata=metadata)
+                
+            except Exception as e2:
+                # Per-video failures are routine in batch ingest, so only include the traceback when debugging
+                logger.error(f"Failed to read transcript for {url} (fallback also failed): {e2}", exc_info=logger.isEnabledFor(logging.DEBUG))
+                return None
+
     def read(self, input_source: Union[str, List[str]]) -> List[Document]:
         """Read YouTube transcript documents."""
         if not input_source:
@@ -47,65 +109,15 @@ class YouTubeReaderProvider:
 
         urls = [input_source] if isinstance(input_source, str) else input_source
         logger.info(f"Reading transcripts from {len(urls)} YouTube video(s)")
-        documents = []
         
-        for url in urls:
-            try:
-                video_id = self._extract_video_id(url)
-                logger.debug(f"Processing video ID: {video_id}")
-                
-                api = YouTubeTranscriptApi()
-                transcript_list = api.fetch(video_id, languages=[self.language])
-                
-                if isinstance(transcript_list, list):
-                    full_text = " ".join([segment.get('text', '') for segment in transcript_list])
-                else:
-                    full_text = str(transcript_list)
-                
-                metadata = {
-                    'video_id': video_id,
-                    'url': url,
-                    'language': self.language,
-                    'source': 'youtube'
-                }
-                
-                if self.metadata_fn:
-                    custom_metadata = self.metadata_fn(url)
-                    metadata.update(custom_metadata)
-                
-                doc = Document(text=full_text, metadata=metadata)
-                documents.append(doc)
-                logger.info(f"Successfully read transcript for video {video_id}")
-                
-            except Exception as e:
-                logger.warning(f"Failed to read transcript for {url} with language {self.language}: {e}")
-                try:
-                    api = YouTubeTranscriptApi()
-                    transcript_list = api.fetch(video_id)
-                    
-                    if isinstance(transcript_list, list):
-                        full_text = " ".join([segment.get('text', '') for segment in transcript_list])
-                    else:
-                        full_text = str(transcript_list)
-                    
-                    metadata = {
-                        'video_id': video_id,
-                        'url': url,
-                        'language': 'auto',
-                        'source': 'youtube'
-                    }
-                    
-                    if self.metadata_fn:
-                        custom_metadata = self.metadata_fn(url)
-                        metadata.update(custom_metadata)
-                    
-                    doc = Document(text=full_text, metadata=metadata)
-                    documents.append(doc)
-                    logger.info(f"Successfully read transcript for video {video_id} with auto language")
-                    
-                except Exception as e2:
-                    logger.error(f"Failed to read transcript for {url} (fallback also failed): {e2}", exc_info=True)
-                    continue
+        # Each fetch is a blocking HTTPS call; map() keeps URL order
+        max_workers = min(self.max_workers or MAX_WORKERS, len(urls))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            documents = [
+                doc
+                for doc in executor.map(self._read_transcript, repeat(YouTubeTranscriptApi), urls)
+                if doc is not None
+            ]
         
         logger.info(f"Successfully read {len(documents)} YouTube transcript(s)")
-        return documents
\ No newline at end of file
+        return documents
@@ -19,4 +19,19 @@ class ReaderProvider(ABC):
         Returns:
             List[Document]: The list of extracted Document objects.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def read_many(self, input_sources: List[Any]) -> List[Document]:
+        """
+        Extract and return the Documents from several input sources, in input order.
+
+        Providers that can process a batch of sources in one pass (sharing thread
+        pools, S3 clients and temp-file housekeeping) override this.
+
+        Args:
+            input_sources: The sources from which to read documents
+
+        Returns:
+            List[Document]: The documents extracted from every source.
+        """
+        return [doc for input_source in input_sources for doc in self.read(input_source)]
\ No newline at end of file
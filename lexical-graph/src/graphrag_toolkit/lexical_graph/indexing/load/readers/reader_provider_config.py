@@ -7,6 +7,9 @@ from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config
 class PDFReaderConfig(ReaderProviderConfig):
     return_full_document: bool = False
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
+    num_workers: Optional[int] = 1  # Worker processes for the pages of large PDFs (advanced reader); 1 parses in the calling process
+    image_mode: str = 'b64_prefix'
+    stream_s3: bool = False  # Parse S3 PDFs from memory instead of downloading them to a temp file
 
 @dataclass
 class DocxReaderConfig(ReaderProviderConfig):
@@ -30,6 +33,7 @@ class HTMLReaderConfig(ReaderProviderConfig):
 class CSVReaderConfig(ReaderProviderConfig):
     concat_rows: bool = True
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
+    backend: str = 'pandas'  # 'arrow' parses with pyarrow; it formats floats and booleans differently ('1', 'true' vs '1.0', 'True'), which changes document text and IDs
 
 @dataclass
 class JSONReaderConfig(ReaderProviderConfig):
@@ -44,14 +48,22 @@ class XMLReaderConfig(ReaderProviderConfig):
 # Document Graph reader
 @dataclass
 class DocumentGraphReaderConfig(ReaderProviderConfig):
-    """Configuration for the Document Graph reader provider."""
+    """Configuration for the Document Graph reader provider.
+
+    metadata_fn receives each document dict and returns its metadata. Values that
+    are None are converted to empty strings and all other values to strings.
+    With metadata_json enabled, dict, list and tuple values are serialized as
+    compact JSON instead of their Python repr.
+    """
     metadata_fn: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    metadata_json: bool = False
 
 # Web readers
 @dataclass
 class WebReaderConfig(ReaderProviderConfig):
     html_to_text: bool = False
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
+    max_workers: Optional[int] = None  # Concurrent page fetches, defaults to one per URL (up to 8)
 
 @dataclass
 class RSSReaderConfig(ReaderProviderConfig):
@@ -113,11 +125,20 @@ class TwitterReaderConfig(ReaderProviderConfig):
 class WikipediaReaderConfig(ReaderProviderConfig):
     lang: str = "en"
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
+    max_workers: Optional[int] = None  # Concurrent page loads, defaults to one per page (up to 8)
+    # Reuse keep-alive connections for Wikipedia API calls. While read() runs, the wikipedia
+    # package's module-level requests reference is swapped for per-thread pooled sessions,
+    # which other users of the wikipedia package in the process also go through
+    pooled_session: bool = False
+    # Resolve titles with one MediaWiki query per 50 titles, then fetch each resolved page's text
+    # with a single request. Resolved titles skip wikipedia.page()'s search-based auto-suggest
+    batch_lookup: bool = False
 
 @dataclass
 class YouTubeReaderConfig(ReaderProviderConfig):
     language: str = "en"
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
+    max_workers: Optional[int] = None  # Concurrent transcript fetches, defaults to one per URL (up to 8)
 
 @dataclass
 class StructuredDataReaderConfig(ReaderProviderConfig):
@@ -128,6 +149,10 @@ class StructuredDataReaderConfig(ReaderProviderConfig):
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
     stream_s3: bool = False  # Default to download, set True to stream
     stream_threshold_mb: int = 100  # Auto-stream files larger than this
+    max_workers: Optional[int] = 1  # Concurrent file reads; 1 reads files one at a time. Above 1, metadata_fn is called from worker threads
+    backend: str = 'pandas'  # 'arrow' parses local CSV/JSONL files with pyarrow; it formats floats and booleans differently ('2', 'true' vs '2.0', 'True'), which changes document text and IDs
+    chunk_size: Optional[int] = None  # Parse CSV/JSONL files this many rows at a time (column types are inferred per chunk)
+    skip_failed_files: bool = False  # Log and skip files that fail to parse instead of raising
     # S3 support - file_path can be local path or s3:// URL
     # AWS credentials handled via GraphRAGConfig.session
 
@@ -136,6 +161,7 @@ class StructuredDataReaderConfig(ReaderProviderConfig):
 class GitHubReaderConfig(ReaderProviderConfig):
     github_token: Optional[str] = None
     verbose: bool = False
+    concurrent_requests: int = 20
     metadata_fn: Optional[Callable[[str], Dict[str, Any]]] = None
 
 @dataclass
@@ -1,11 +1,15 @@
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 @dataclass
 class ReaderProviderConfig(ABC):
     """Base configuration class for all reader providers."""
-    pass
+    # Stage small S3 downloads in RAM-backed /dev/shm rather than the default temp dir. Files
+    # orphaned by a crashed process hold memory until they are removed or the host reboots.
+    # Keyword-only, so subclasses can still declare required fields and positional arguments
+    # bind to the subclass's own fields.
+    s3_memory_temp_dir: bool = field(default=False, kw_only=True)
 
 @dataclass
 class AWSReaderConfigBase(ReaderProviderConfig):
@@ -3,22 +3,86 @@ S3 file handling mixin for reader providers that process file paths.
 Provides universal S3 support for any reader that accepts file paths.
 """
 
+import errno
 import tempfile
 import os
-from typing import Union, List
+import shutil
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from functools import cache
+from typing import Callable, Dict, Optional, Union, List, Tuple
 from graphrag_toolkit.lexical_graph.logging import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent S3 downloads in _process_file_paths
+MAX_DOWNLOAD_WORKERS = 8
+
+# Objects up to this size are fetched with a single ranged GetObject instead of
+# download_file, which issues a HeadObject and sets up a transfer manager first
+SMALL_OBJECT_THRESHOLD = 8 * 1024 * 1024
+COPY_BUFFER_SIZE = 64 * 1024
+
+# RAM-backed directory for the temporary files of small objects when a reader's config sets
+# s3_memory_temp_dir, so that writing and re-reading them doesn't touch disk. It is only used
+# while it has room for a full set of concurrent small downloads (container shm is often
+# just 64MB); large objects, and downloads that run out of space, use the default temp dir.
+MEMORY_TEMP_DIR = '/dev/shm'
+MEMORY_TEMP_DIR_MIN_FREE_BYTES = MAX_DOWNLOAD_WORKERS * SMALL_OBJECT_THRESHOLD
+
+# Local paths are checked by listing their directory once when at least this many of
+# them share a directory; fewer paths are checked individually with os.path.exists
+SCANDIR_MIN_PATHS = 8
+
+# Number of S3 object sizes remembered per provider, so repeated size checks for the
+# same object don't each cost a HeadObject round-trip
+FILE_SIZE_CACHE_SIZE = 1024
+
+# Presigned URLs are valid for PRESIGNED_URL_EXPIRY seconds
+PRESIGNED_URL_EXPIRY = 3600
+
+@cache
+def _get_memory_temp_dir() -> Optional[str]:
+    """Return MEMORY_TEMP_DIR if it is a writable directory on this host, otherwise None."""
+    if os.path.isdir(MEMORY_TEMP_DIR) and os.access(MEMORY_TEMP_DIR, os.W_OK | os.X_OK):
+        return MEMORY_TEMP_DIR
+    return None
+
 class S3FileMixin:
     """Mixin to add S3 file support to any path-based reader provider."""
     
-    def _is_s3_path(self, path: str) -> bool:
+    # Per-provider cache of S3 object sizes, bounded by FILE_SIZE_CACHE_SIZE (oldest entries
+    # are evicted first). It is created on first use by the _s3_file_sizes property.
+    _s3_file_size_cache: Optional[Dict[str, int]] = None
+    
+    @property
+    def _s3_file_sizes(self) -> Dict[str, int]:
+        if self._s3_file_size_cache is None:
+            self._s3_file_size_cache = {}
+        return self._s3_file_size_cache
+    
+    @staticmethod
+    def _is_s3_path(path: str) -> bool:
         """Check if path is an S3 URL."""
         return path.startswith('s3://')
     
+    @staticmethod
+    def _parse_s3_path(s3_path: str) -> Tuple[str, str]:
+        """Split an S3 URL into its bucket and key."""
+        bucket, separator, key = s3_path.removeprefix('s3://').partition('/')
+        if not separator:
+            logger.error(f"Invalid S3 path format: {s3_path}")
+            raise ValueError(f"Invalid S3 path format: {s3_path}. Expected s3://bucket/key")
+        return bucket, key
+    
+    @staticmethod
+    def _get_suffix(key: str) -> str:
+        """Return the file extension of an S3 key, matching os.path.splitext(key)[1]."""
+        stem, _, extension = key.rpartition('/')[2].rpartition('.')
+        # As with splitext, dots leading the file name don't start an extension
+        return f'.{extension}' if stem.strip('.') else ''
+    
     def _download_s3_file(self, s3_path: str) -> str:
-        """Download S3 file to a temporary location using GraphRAGConfig session."""
+        """Download S3 file to a temporary location using the shared GraphRAGConfig S3 client."""
         try:
             from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
         except ImportError as e:
@@ -26,29 +90,127 @@ class S3FileMixin:
             raise ImportError("S3 support requires GraphRAGConfig") from e
         
         try:
-            s3_path_clean = s3_path.replace('s3://', '')
-            if '/' not in s3_path_clean:
-                logger.error(f"Invalid S3 path format: {s3_path}")
-                raise ValueError(f"Invalid S3 path format: {s3_path}. Expected s3://bucket/key")
-            
-            bucket, key = s3_path_clean.split('/', 1)
+            bucket, key = self._parse_s3_path(s3_path)
             logger.info(f"Downloading S3 file: s3://{bucket}/{key}")
             
-            aws_session = GraphRAGConfig.session
-            s3_client = aws_session.client('s3')
+            s3_client = GraphRAGConfig.s3
             
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False, 
-                suffix=os.path.splitext(key)[1]
-            )
-            s3_client.download_file(bucket, key, temp_file.name)
-            temp_file.close()
+            suffix = self._get_suffix(key)
+            # Skip the ranged GetObject when an earlier size check already showed the object is large
+            known_size = self._s3_file_sizes.get(s3_path)
+            temp_path = None
+            if known_size is None or known_size <= SMALL_OBJECT_THRESHOLD:
+                temp_path = self._download_small_s3_file(s3_client, bucket, key, suffix)
+            if temp_path is None:
+                with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+                    temp_path = temp_file.name
+                s3_client.download_file(bucket, key, temp_path)
             
-            logger.debug(f"Downloaded to temporary file: {temp_file.name}")
-            return temp_file.name
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Downloaded to temporary file: {temp_path}")
+            return temp_path
         except Exception as e:
-            logger.error(f"Failed to download S3 file {s3_path}: {e}", exc_info=True)
-            raise RuntimeError(f"Failed to download S3 file: {e}") from e
+            # The calling provider logs the traceback and wraps the error at its read() boundary
+            logger.error(f"Failed to download S3 file {s3_path}: {e}")
+            raise
+    
+    def _get_small_object_temp_dirs(self) -> List[Optional[str]]:
+        """
+        Return the directories to try, in order, for the temp file of a small object: the
+        memory-backed directory (if the config opts in and it has room), then the default.
+        """
+        if not getattr(getattr(self, 'config', None), 's3_memory_temp_dir', False):
+            return [None]
+        memory_temp_dir = _get_memory_temp_dir()
+        if memory_temp_dir is None:
+            return [None]
+        try:
+            if shutil.disk_usage(memory_temp_dir).free < MEMORY_TEMP_DIR_MIN_FREE_BYTES:
+                return [None]
+        except OSError:
+            return [None]
+        return [memory_temp_dir, None]
+    
+    def _download_small_s3_file(self, s3_client, bucket: str, key: str, suffix: str) -> Optional[str]:
+        """
+        Fetch a small object into a new temp file with a single ranged GetObject. Returns the
+        temp file's path, or None (leaving no file behind) if the object is large or the
+        fetch fails. A memory-backed directory that runs out of space falls back to the
+        default temp dir.
+        """
+        for temp_dir in self._get_small_object_temp_dirs():
+            temp_path = None
+            try:
+                with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=temp_dir) as temp_file:
+                    temp_path = temp_file.name
+                    downloaded = self._download_small_s3_object(s3_client, bucket, key, temp_file)
+            except Exception as e:
+                if temp_path is not None:
+                    os.unlink(temp_path)
+                if temp_dir is not None and isinstance(e, OSError) and e.errno == errno.ENOSPC:
+                    logger.debug(f"No space left in {temp_dir}, staging s3://{bucket}/{key} in the default temp dir")
+                    continue
+                logger.debug(f"Single request download failed for s3://{bucket}/{key}, using download_file: {e}")
+                return None
+            if downloaded:
+                return temp_path
+            os.unlink(temp_path)
+            return None
+        return None
+    
+    @staticmethod
+    def _download_small_s3_object(s3_client, bucket: str, key: str, file_obj) -> bool:
+        """
+        Fetch up to SMALL_OBJECT_THRESHOLD bytes of an object with one ranged GetObject and
+        write them to file_obj. Returns False, writing nothing, if the object is larger.
+        """
+        response = s3_client.get_object(Bucket=bucket, Key=key, Range=f'bytes=0-{SMALL_OBJECT_THRESHOLD - 1}')
+        body = response['Body']
+        content_range = response.get('ContentRange')
+        if content_range and int(content_range.rsplit('/', 1)[1]) > SMALL_OBJECT_THRESHOLD:
+            body.close()
+            return False
+        shutil.copyfileobj(body, file_obj, COPY_BUFFER_SIZE)
+        return True
+    
+    @staticmethod
+    def _flatten_paths(input_sources: List[Union[str, List[str]]]) -> List[str]:
+        """Flatten a batch of input sources, each a path or a list of paths, into one list of paths."""
+        return [
+            path
+            for input_source in input_sources
+            for path in ([input_source] if isinstance(input_source, str) else input_source)
+        ]
+    
+    @staticmethod
+    def _find_missing_path(paths: List[str]) -> Optional[str]:
+        """
+        Return the first path (in input order) that does not exist, or None.
+
+        Directories holding at least SCANDIR_MIN_PATHS of the paths are listed once
+        with os.scandir instead of stat-ing each path. Names that aren't listed, or
+        are symlinks, are still checked with os.path.exists, so the result is the
+        same as checking every path with os.path.exists.
+        """
+        paths_by_dir = {}
+        for path in paths:
+            paths_by_dir.setdefault(os.path.dirname(path), []).append(path)
+        
+        found = set()
+        for directory, dir_paths in paths_by_dir.items():
+            if len(dir_paths) < SCANDIR_MIN_PATHS:
+                continue
+            try:
+                with os.scandir(directory or '.') as entries:
+                    names = {entry.name for entry in entries if not entry.is_symlink()}
+            except OSError:
+                continue
+            found.update(path for path in dir_paths if os.path.basename(path) in names)
+        
+        for path in paths:
+            if path not in found and not os.path.exists(path):
+                return path
+        return None
     
     def _process_file_paths(self, paths: Union[str, List[str]]) -> tuple:
         """
@@ -58,46 +220,87 @@ class S3FileMixin:
         if isinstance(paths, str):
             paths = [paths]
         
-        processed_paths = []
+        # Check local files before downloading anything, so a missing file fails fast
+        local_paths = [path for path in paths if not path.startswith('s3://')]
+        missing_path = self._find_missing_path(local_paths)
+        if missing_path is not None:
+            logger.error(f"Local file not found: {missing_path}")
+            raise FileNotFoundError(f"File not found: {missing_path}")
+        
+        if len(local_paths) == len(paths):
+            # All-local batch: nothing to download or clean up
+            return list(paths), [], list(paths)
+        
+        original_paths = list(paths)
+        processed_paths = list(paths)
+        s3_indexes = [i for i, path in enumerate(paths) if self._is_s3_path(path)]
+        
+        # Downloads are independent network transfers, so they run concurrently; results are
+        # written back by input position to preserve the original path order
+        with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(s3_indexes))) as executor:
+            futures = {executor.submit(self._download_s3_file, paths[i]): i for i in s3_indexes}
+            _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+        
         temp_files = []
-        original_paths = []
+        error = None
+        for future, i in futures.items():
+            if future.cancelled():
+                continue
+            if future.exception() is not None:
+                error = error or future.exception()
+                continue
+            processed_paths[i] = future.result()
+            temp_files.append(future.result())
         
-        for path in paths:
-            original_paths.append(path)
-            if self._is_s3_path(path):
-                try:
-                    temp_path = self._download_s3_file(path)
-                    processed_paths.append(temp_path)
-                    temp_files.append(temp_path)
-                except Exception as e:
-                    logger.error(f"Failed to process S3 path {path}: {e}")
-                    self._cleanup_temp_files(temp_files)
-                    raise
-            else:
-                if not os.path.exists(path):
-                    logger.error(f"Local file not found: {path}")
-                    self._cleanup_temp_files(temp_files)
-                    raise FileNotFoundError(f"File not found: {path}")
-                processed_paths.append(path)
+        if error is not None:
+            self._cleanup_temp_files(temp_files)
+            raise error
         
         return processed_paths, temp_files, original_paths
     
+    def _load_files(self, load_file: Callable[[str], list], processed_paths: List[str], original_paths: List[str]) -> list:
+        """
+        Load every processed file with load_file, in input order, and apply the
+        provider's metadata_fn (if any) using each file's original path.
+        """
+        documents = []
+        for processed_path, original_path in zip(processed_paths, original_paths):
+            file_documents = load_file(processed_path)
+            if self.metadata_fn:
+                # Same path for every document from this file, so compute once per file
+                additional_metadata = self.metadata_fn(original_path)
+                source_type = self._get_file_source_type(original_path)
+                for doc in file_documents:
+                    doc.metadata.update(additional_metadata)
+                    doc.metadata['source'] = source_type
+            documents.extend(file_documents)
+        return documents
+    
     def _cleanup_temp_files(self, temp_files: List[str]):
         """Clean up temporary files."""
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for temp_file in temp_files:
             try:
                 if os.path.exists(temp_file):
                     os.unlink(temp_file)
-                    logger.debug(f"Cleaned up temporary file: {temp_file}")
+                    if debug_enabled:
+                        logger.debug(f"Cleaned up temporary file: {temp_file}")
             except Exception as e:
                 logger.warning(f"Failed to clean up temporary file {temp_file}: {e}")
     
-    def _get_file_source_type(self, original_path: str) -> str:
+    @staticmethod
+    def _get_file_source_type(original_path: str) -> str:
         """Get a source type for metadata."""
-        return 's3' if self._is_s3_path(original_path) else 'local_file'
+        return 's3' if original_path.startswith('s3://') else 'local_file'
     
     def _get_s3_file_size(self, s3_path: str) -> int:
-        """Get S3 file size in bytes."""
+        """Get S3 file size in bytes. Sizes are cached per provider; failed lookups are not cached."""
+        file_sizes = self._s3_file_sizes
+        if s3_path in file_sizes:
+            return file_sizes[s3_path]
+        
         try:
             from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
         except ImportError as e:
@@ -105,17 +308,56 @@ class S3FileMixin:
             raise ImportError("S3 support requires GraphRAGConfig") from e
         
         try:
-            s3_path_clean = s3_path.replace('s3://', '')
-            bucket, key = s3_path_clean.split('/', 1)
+            bucket, key = self._parse_s3_path(s3_path)
             
-            aws_session = GraphRAGConfig.session
-            s3_client = aws_session.client('s3')
+            s3_client = GraphRAGConfig.s3
             
             response = s3_client.head_object(Bucket=bucket, Key=key)
-            return response['ContentLength']
+            file_size = response['ContentLength']
+            self._cache_s3_file_size(s3_path, file_size)
+            return file_size
         except Exception as e:
             logger.error(f"Failed to get S3 file size for {s3_path}: {e}")
-            raise RuntimeError(f"Failed to get S3 file size: {e}") from e
+            raise
+    
+    def _cache_s3_file_size(self, s3_path: str, file_size: int):
+        file_sizes = self._s3_file_sizes
+        if s3_path not in file_sizes and len(file_sizes) >= FILE_SIZE_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            file_sizes.pop(next(iter(file_sizes)), None)
+        file_sizes[s3_path] = file_size
+    
+    def _read_s3_file(self, s3_path: str, max_bytes: int) -> Optional[bytes]:
+        """
+        Read an S3 file of at most max_bytes into memory with a single ranged GetObject.
+        Returns None, without reading the body, if the object is larger; its size is then
+        cached, so a following _download_s3_file goes straight to download_file.
+        """
+        try:
+            from graphrag_toolkit.lexical_graph.config import GraphRAGConfig
+        except ImportError as e:
+            logger.error("GraphRAGConfig not available for S3 support")
+            raise ImportError("S3 support requires GraphRAGConfig") from e
+        
+        try:
+            bucket, key = self._parse_s3_path(s3_path)
+            logger.info(f"Reading S3 file: s3://{bucket}/{key}")
+            
+            s3_client = GraphRAGConfig.s3
+            
+            response = s3_client.get_object(Bucket=bucket, Key=key, Range=f'bytes=0-{max_bytes - 1}')
+            body = response['Body']
+            content_range = response.get('ContentRange')
+            if content_range:
+                file_size = int(content_range.rsplit('/', 1)[1])
+                if file_size > max_bytes:
+                    body.close()
+                    self._cache_s3_file_size(s3_path, file_size)
+                    return None
+            return body.read()
+        except Exception as e:
+            logger.error(f"Failed to read S3 file {s3_path}: {e}")
+            raise
     
     def _get_s3_stream_url(self, s3_path: str) -> str:
         """Get S3 presigned URL for streaming."""
@@ -126,22 +368,21 @@ class S3FileMixin:
             raise ImportError("S3 support requires GraphRAGConfig") from e
         
         try:
-            s3_path_clean = s3_path.replace('s3://', '')
-            bucket, key = s3_path_clean.split('/', 1)
+            bucket, key = self._parse_s3_path(s3_path)
             
-            aws_session = GraphRAGConfig.session
-            s3_client = aws_session.client('s3')
+            s3_client = GraphRAGConfig.s3
             
             url = s3_client.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': bucket, 'Key': key},
-                ExpiresIn=3600
+                ExpiresIn=PRESIGNED_URL_EXPIRY
             )
-            logger.debug(f"Generated presigned URL for {s3_path}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Generated presigned URL for {s3_path}")
             return url
         except Exception as e:
             logger.error(f"Failed to generate presigned URL for {s3_path}: {e}")
-            raise RuntimeError(f"Failed to generate presigned URL: {e}") from e
+            raise
     
     def _should_stream_s3_file(self, s3_path: str, stream_s3: bool, threshold_mb: int) -> bool:
         """Determine if S3 file should be streamed based on config and size."""
@@ -152,7 +393,8 @@ class S3FileMixin:
             file_size_bytes = self._get_s3_file_size(s3_path)
             file_size_mb = file_size_bytes / (1024 * 1024)
             should_stream = file_size_mb > threshold_mb
-            logger.debug(f"File size: {file_size_mb:.2f}MB, threshold: {threshold_mb}MB, streaming: {should_stream}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"File size: {file_size_mb:.2f}MB, threshold: {threshold_mb}MB, streaming: {should_stream}")
             return should_stream
         except Exception as e:
             logger.warning(f"Could not determine file size for {s3_path}, defaulting to download: {e}")
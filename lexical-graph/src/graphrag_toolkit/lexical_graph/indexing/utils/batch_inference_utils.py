@@ -52,16 +52,14 @@ def split_nodes(nodes: List[Any], batch_size: int) -> List[List[Any]]:
     if len(nodes) < BEDROCK_MIN_BATCH_SIZE:
         raise BatchJobError(f'Job contains fewer records ({len(nodes)}) than the minimum required by Bedrock ({BEDROCK_MIN_BATCH_SIZE})')
     
-    i = 0
-    results = []
-
-    while i < len(nodes):
-        if len(nodes) - (i + batch_size) < BEDROCK_MIN_BATCH_SIZE:
-            results.append(nodes[i:])
-            break
-        else:
-            results.append(nodes[i:i + batch_size])
-        i += batch_size
+    # A batch starting at i is a full batch only if at least BEDROCK_MIN_BATCH_SIZE
+    # records follow it; the batch after the last full one takes all remaining records
+    max_full_batch_start = len(nodes) - batch_size - BEDROCK_MIN_BATCH_SIZE
+    num_full_batches = max_full_batch_start // batch_size + 1 if max_full_batch_start >= 0 else 0
+    last_batch_start = num_full_batches * batch_size
+
+    results = [nodes[i:i + batch_size] for i in range(0, last_batch_start, batch_size)]
+    results.append(nodes[last_batch_start:])
    
     return results
 
@@ -238,23 +236,39 @@ def download_output_files(s3_client: Any, bucket_name:str, output_path:str, inpu
         s3_client.download_file(Bucket=bucket_name, Key=key, Filename=local_file_path)
         logger.debug(f'Finished downloading {key} to {local_file_path}')
 
+# The output parsers index directly and treat a missing key as empty output, rather than
+# chaining .get(key, {}), which builds a throwaway default dict at every level of every record
+
+def _get_nova_output_text(json_data):
+    try:
+        contents = json_data['modelOutput']['output']['message']['content']
+    except KeyError:
+        return ''
+    return ''.join([content.get('text', '') for content in contents])
+
+def _get_claude_output_text(json_data):
+    try:
+        contents = json_data['modelOutput']['content']
+    except KeyError:
+        return ''
+    return ''.join([content.get('text', '') for content in contents])
+
+def _get_llama_output_text(json_data):
+    return json_data['generation']
+
+# Output text parsers, matched in order against the model ID (which may be prefixed
+# with an inference profile region, e.g. 'us.amazon.nova-pro-v1:0')
+OUTPUT_TEXT_PARSERS = (
+    ('amazon.nova', _get_nova_output_text),
+    ('anthropic.claude', _get_claude_output_text),
+    ('meta.llama', _get_llama_output_text)
+)
+
 def get_parse_output_text_fn(model_id:str): 
-    if 'amazon.nova' in model_id:
-        def get_output_text(json_data):
-            contents = json_data.get('modelOutput', {}).get('output', {}).get('message', {}).get('content', [])
-            return ''.join([content.get('text', '') for content in contents])
-        return get_output_text
-    elif 'anthropic.claude' in model_id:
-        def get_output_text(json_data):
-            contents = json_data.get('modelOutput', {}).get('content', [])
-            return ''.join([content.get('text', '') for content in contents])
-        return get_output_text
-    elif 'meta.llama' in model_id:
-        def get_output_text(json_data):
-            return json_data['generation']
-        return get_output_text
-    else:
-        raise ValueError(f'Unrecognized model_id: batch extraction for {model_id} is not supported') 
+    for model_family, parse_output_text in OUTPUT_TEXT_PARSERS:
+        if model_family in model_id:
+            return parse_output_text
+    raise ValueError(f'Unrecognized model_id: batch extraction for {model_id} is not supported') 
 
 async def process_batch_output(local_output_directory:str, input_filename:str, llm:LLMCache) -> Dict[str, str]:
     """Process batch output files and return results."""
@@ -2,19 +2,185 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import hashlib
+from typing import Callable, Iterable, Union
 
-def get_hash(s):
+MD5 = 'md5'
+BLAKE3 = 'blake3'
+SHA256 = 'sha256'
+
+# Inputs at or above this size let the blake3 Rust core spread a single
+# hash across multiple threads; below it, thread start-up costs more than it saves.
+BLAKE3_MULTITHREAD_THRESHOLD = 1024 * 1024
+
+# IDs are not a security use of MD5, so every MD5 constructor passes
+# usedforsecurity=False, which keeps ID generation working on FIPS-mode builds.
+
+# Empty MD5 state that the single-string fast paths copy from; copying an initialized
+# state is cheaper than setting up a new hasher. It is never updated, so it can be
+# shared across threads.
+_MD5_EMPTY_STATE = hashlib.md5(usedforsecurity=False)
+
+def _md5_hex(*parts:bytes) -> str:
+        h = hashlib.md5(usedforsecurity=False)
+        for part in parts:
+            h.update(part)
+        return h.hexdigest()
+
+def _blake3_hex(*parts:bytes) -> str:
+        try:
+            import blake3
+        except ImportError as e:
+            raise ImportError(
+                "blake3 package not found, install with 'pip install blake3'"
+            ) from e
+        if sum(len(part) for part in parts) >= BLAKE3_MULTITHREAD_THRESHOLD:
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        else:
+            hasher = blake3.blake3()
+        for part in parts:
+            hasher.update(part)
+        # 16-byte digest, so that IDs have the same length as MD5-based IDs
+        return hasher.hexdigest(length=16)
+
+# MD5 states that have already absorbed a tenant prefix, keyed by prefix. There is one
+# entry per tenant seen in the process, so the dict stays small.
+_MD5_PREFIX_STATES = {}
+
+def _md5_prefix_state(prefix:str):
+        state = _MD5_PREFIX_STATES.get(prefix)
+        if state is None:
+            state = _MD5_PREFIX_STATES.setdefault(prefix, hashlib.md5(prefix.encode('utf-8'), usedforsecurity=False))
+        return state
+
+def _sha256_hex(*parts:bytes) -> str:
+        h = hashlib.sha256()
+        for part in parts:
+            h.update(part)
+        # Truncated to 16 bytes, so that IDs have the same length as MD5-based IDs.
+        # OpenSSL uses the SHA extensions (SHA-NI / ARMv8 SHA2) where the CPU has them.
+        return h.hexdigest()[:32]
+
+_HASH_FNS = {
+    MD5: _md5_hex,
+    BLAKE3: _blake3_hex,
+    SHA256: _sha256_hex
+}
+
+def _get_hash_fn(hash_algorithm:str) -> Callable[..., str]:
+        hash_fn = _HASH_FNS.get(hash_algorithm)
+        if hash_fn is None:
+            raise ValueError(f"Unsupported hash algorithm: '{hash_algorithm}'. Supported algorithms: {list(_HASH_FNS.keys())}")
+        return hash_fn
+
+def normalize_hash_algorithm(hash_algorithm:str) -> str:
         """
-        Generates an MD5 hash for a given string.
+        Lowercases a hash algorithm name and checks that it is supported.
 
-        This method computes the MD5 hash of a provided string and returns its
+        Args:
+            hash_algorithm: The hash algorithm name, e.g. 'md5' or 'SHA256'.
+
+        Returns:
+            The lowercase algorithm name.
+
+        Raises:
+            ValueError: If the algorithm is not 'md5', 'blake3' or 'sha256'.
+        """
+        normalized = hash_algorithm.strip().lower() if isinstance(hash_algorithm, str) else hash_algorithm
+        _get_hash_fn(normalized)
+        return normalized
+
+def get_hash(s, hash_algorithm:str=MD5):
+        """
+        Generates a hash for a given string.
+
+        This method computes the hash of a provided string and returns its
         hexadecimal representation. It is used internally to generate unique hashed
         values based on string inputs.
 
         Args:
             s: The input string to be hashed.
+            hash_algorithm: The hash algorithm to use ('md5', 'blake3' or 'sha256'). Defaults to 'md5'.
+
+        Returns:
+            The 32-character hexadecimal representation of the hash of the input string.
+        """
+        if hash_algorithm == MD5:
+            h = _MD5_EMPTY_STATE.copy()
+            h.update(s.encode('utf-8'))
+            return h.hexdigest()
+        return _get_hash_fn(hash_algorithm)(s.encode('utf-8'))
+
+def get_hash_prefix(s, length:int, hash_algorithm:str=MD5) -> str:
+        """
+        Generates the leading hexadecimal characters of the hash of a given string.
+
+        Equivalent to `get_hash(s, hash_algorithm)[:length]`, but resolves the hash
+        function and truncates the digest in a single call, which keeps the
+        per-ID overhead down for the truncated source and chunk IDs.
+
+        Args:
+            s: The input string to be hashed.
+            length: The number of hexadecimal characters to return.
+            hash_algorithm: The hash algorithm to use ('md5', 'blake3' or 'sha256'). Defaults to 'md5'.
+
+        Returns:
+            The first `length` characters of the hexadecimal hash of the input string.
+        """
+        if hash_algorithm == MD5:
+            h = _MD5_EMPTY_STATE.copy()
+            h.update(s.encode('utf-8'))
+            return h.hexdigest()[:length]
+        return _get_hash_fn(hash_algorithm)(s.encode('utf-8'))[:length]
+
+def _encode_part(part:Union[str, bytes]) -> bytes:
+        return part if isinstance(part, bytes) else part.encode('utf-8')
+
+def get_hash_parts(parts:Iterable[Union[str, bytes]], hash_algorithm:str=MD5) -> str:
+        """
+        Generates a hash for the concatenation of several strings.
+
+        The parts are fed to the hash function one after another, which gives the
+        same digest as `get_hash(''.join(parts))` without building the
+        concatenated string. This matters for large inputs such as chunk text.
+        Parts that are already bytes (e.g. a delimiter byte that cannot occur in
+        UTF-8 text) are hashed as-is.
+
+        Args:
+            parts: The strings (or bytes) to be hashed, in order.
+            hash_algorithm: The hash algorithm to use ('md5', 'blake3' or 'sha256'). Defaults to 'md5'.
+
+        Returns:
+            The 32-character hexadecimal representation of the hash of the concatenated parts.
+        """
+        if hash_algorithm == MD5:
+            h = hashlib.md5(usedforsecurity=False)
+            for part in parts:
+                h.update(_encode_part(part))
+            return h.hexdigest()
+        return _get_hash_fn(hash_algorithm)(*[_encode_part(part) for part in parts])
+
+def get_affixed_hash(prefix:str, s:str, suffix:str='', hash_algorithm:str=MD5) -> str:
+        """
+        Generates a hash for a string wrapped in a fixed prefix and suffix.
+
+        Gives the same digest as `get_hash(prefix + s + suffix)`. For MD5, the
+        hash state after absorbing the prefix is computed once per prefix and
+        copied for each call, so a tenant prefix is not re-hashed (or
+        concatenated) for every ID.
+
+        Args:
+            prefix: The fixed leading string, e.g. a tenant's hashable prefix.
+            s: The input string to be hashed.
+            suffix: The fixed trailing string. Defaults to ''.
+            hash_algorithm: The hash algorithm to use ('md5', 'blake3' or 'sha256'). Defaults to 'md5'.
 
         Returns:
-            The hexadecimal representation of the MD5 hash of the input string.
+            The 32-character hexadecimal representation of the hash.
         """
-        return hashlib.md5(s.encode('utf-8')).digest().hex()
\ No newline at end of file
+        if hash_algorithm == MD5 and prefix:
+            h = _md5_prefix_state(prefix).copy()
+            h.update(s.encode('utf-8'))
+            if suffix:
+                h.update(suffix.encode('utf-8'))
+            return h.hexdigest()
+        return get_hash(prefix + s + suffix, hash_algorithm)
@@ -5,15 +5,13 @@ import datetime
 from typing import Dict, List, Any, Tuple
 from graphrag_toolkit.lexical_graph.versioning import VERSIONING_METADATA_KEYS
 
+COLLECTION_TYPES = (list, dict, set)
+
 def remove_collection_items_from_metadata(metadata:Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
     clean_metadata = {}
     invalid_items = {}
     for k,v in metadata.items():
-        if isinstance(v, list):
-            invalid_items[k] = v
-        elif isinstance(v, dict):
-            invalid_items[k] = v
-        elif isinstance(v, set):
+        if isinstance(v, COLLECTION_TYPES):
             invalid_items[k] = v
         else:
             clean_metadata[k] = v
@@ -21,7 +19,11 @@ def remove_collection_items_from_metadata(metadata:Dict[str, Any]) -> Tuple[Dict
 
 def get_properties_str(properties, default):
     if properties:
-        return ';'.join(sorted([f'{k}:{v}' for k,v in properties.items()]))
+        # Sort the formatted pairs rather than the keys: keys containing characters
+        # that sort before ':' would otherwise change the order (and derived IDs)
+        properties_strs = [f'{k}:{v}' for k,v in properties.items()]
+        properties_strs.sort()
+        return ';'.join(properties_strs)
     else:
         return default
         
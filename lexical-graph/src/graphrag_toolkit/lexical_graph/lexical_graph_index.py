@@ -283,7 +283,7 @@ class LexicalGraphIndex():
 
         self.graph_store = MultiTenantGraphStore.wrap(GraphStoreFactory.for_graph_store(graph_store), tenant_id)
         self.vector_store = MultiTenantVectorStore.wrap(VectorStoreFactory.for_vector_store(vector_store), tenant_id)
-        self.tenant_id = tenant_id or TenantId()
+        self.tenant_id = tenant_id or DEFAULT_TENANT_ID
         self.extraction_dir = extraction_dir or DEFAULT_EXTRACTION_DIR
         self.indexing_config = to_indexing_config(indexing_config)
 
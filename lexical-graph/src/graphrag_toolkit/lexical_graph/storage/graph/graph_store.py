@@ -9,7 +9,7 @@ from tenacity import Retrying, stop_after_attempt, wait_random
 from tenacity import RetryCallState
 from typing import Callable, List, Dict, Any, Optional, Union
 
-from graphrag_toolkit.lexical_graph import TenantId, GraphQueryError
+from graphrag_toolkit.lexical_graph import TenantId, DEFAULT_TENANT_ID, GraphQueryError
 from graphrag_toolkit.lexical_graph.storage.graph.query_tree import QueryTree
 
 from llama_index.core.bridge.pydantic import BaseModel, Field
@@ -377,7 +377,7 @@ class GraphStore(BaseModel):
         tenant_id (TenantId): Represents the unique identifier of the tenant.
     """
     log_formatting:GraphQueryLogFormatting = Field(default_factory=lambda: RedactedGraphQueryLogFormatting())
-    tenant_id:TenantId = Field(default_factory=lambda: TenantId())
+    tenant_id:TenantId = Field(default_factory=lambda: DEFAULT_TENANT_ID)
 
     def __enter__(self):
         logger.debug(f'Entering {type(self).__name__}')
@@ -11,7 +11,7 @@ from llama_index.core.bridge.pydantic import BaseModel, Field, field_validator
 from llama_index.core.vector_stores.types import MetadataFilters
 
 from graphrag_toolkit.lexical_graph.metadata import FilterConfig
-from graphrag_toolkit.lexical_graph import EmbeddingType, TenantId
+from graphrag_toolkit.lexical_graph import EmbeddingType, TenantId, DEFAULT_TENANT_ID
 from graphrag_toolkit.lexical_graph.storage.constants import ALL_EMBEDDING_INDEXES
 
 
@@ -63,7 +63,7 @@ class VectorIndex(BaseModel):
         writeable (bool): A flag indicating if the index is in writable mode. Defaults to True.
     """
     index_name: str
-    tenant_id:TenantId = Field(default_factory=lambda: TenantId())
+    tenant_id:TenantId = Field(default_factory=lambda: DEFAULT_TENANT_ID)
     writeable:bool = True
 
     @field_validator('index_name')
@@ -2,11 +2,22 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import re
+from functools import lru_cache
 from typing import Optional, Union
-from llama_index.core.bridge.pydantic import BaseModel
+from llama_index.core.bridge.pydantic import BaseModel, ConfigDict
 
 DEFAULT_TENANT_NAME = 'default_'
 
+# Valid ASCII tenant IDs: 1-25 lowercase letters, digits and periods, not starting or ending with a period
+_ASCII_TENANT_ID_PATTERN = re.compile(r'[a-z0-9](?:[a-z0-9.]{0,23}[a-z0-9])?')
+
+# Number of tenant ID strings whose TenantId instances are reused by to_tenant_id
+TENANT_ID_CACHE_SIZE = 256
+
+# Number of (tenant, label) and (tenant, index name) pairs whose formatted names are reused.
+# Each tenant has a small, fixed set of graph labels and vector index names.
+FORMATTED_NAME_CACHE_SIZE = 1024
+
 class TenantId(BaseModel):
     """
     Represents a TenantId with validation logic, supporting default and custom tenant formats.
@@ -18,9 +29,14 @@ class TenantId(BaseModel):
     numbers, and periods (not at start/end), and are between 1 and 25
     characters in length.
 
+    Tenant IDs are immutable, so a single instance (e.g. `DEFAULT_TENANT_ID`) can be
+    shared by every generator, store and index that uses the tenant.
+
     Attributes:
         value (Optional[str]): The tenant identifier. None indicates the default tenant.
     """
+    model_config = ConfigDict(frozen=True)
+
     value: Optional[str] = None
 
     def __init__(self, value: str = None):
@@ -45,6 +61,8 @@ class TenantId(BaseModel):
 
     def _is_valid_tenant_id(self, value: str) -> bool:
         """ Validates a tenant ID format with backwards compatibility."""
+        if value and value.isascii():
+            return _ASCII_TENANT_ID_PATTERN.fullmatch(value) is not None
         if (
             not value
             or len(value) > 25
@@ -83,9 +101,7 @@ class TenantId(BaseModel):
         Returns:
             str: The formatted label.
         """
-        if self.is_default_tenant():
-            return f'`{label}`'
-        return f'`{label}{self.value}__`'
+        return _format_label(self.value, label)
 
     def format_index_name(self, index_name: str):
         """
@@ -99,9 +115,7 @@ class TenantId(BaseModel):
         Returns:
             str: The formatted index name with a tenant-specific suffix, if applicable.
         """
-        if self.is_default_tenant():
-            return index_name
-        return f'{index_name}_{self.value}'
+        return _format_index_name(self.value, index_name)
 
     def format_hashable(self, hashable: str):
         """
@@ -117,10 +131,12 @@ class TenantId(BaseModel):
         Returns:
             str: The formatted hashable string.
         """
-        if self.is_default_tenant():
+        # Reads value directly rather than calling is_default_tenant(); callers may format one hashable per ID
+        value = self.value
+        if value is None:
             return hashable
         else:
-            return f'{self.value}::{hashable}'
+            return f'{value}::{hashable}'
 
     def format_id(self, prefix: str, id_value: str):
         """
@@ -168,6 +184,20 @@ class TenantId(BaseModel):
             return f'{id_parts[0]}:{self.value}:{":".join(id_parts[2:])}'
 
 
+@lru_cache(maxsize=FORMATTED_NAME_CACHE_SIZE)
+def _format_label(value: Optional[str], label: str) -> str:
+    # Labels are formatted for every rewritten query, so results are memoized per tenant value
+    if value is None:
+        return f'`{label}`'
+    return f'`{label}{value}__`'
+
+@lru_cache(maxsize=FORMATTED_NAME_CACHE_SIZE)
+def _format_index_name(value: Optional[str], index_name: str) -> str:
+    if value is None:
+        return index_name
+    return f'{index_name}_{value}'
+
+
 DEFAULT_TENANT_ID = TenantId()
 
 TenantIdType = Union[str, TenantId]
@@ -191,5 +221,9 @@ def to_tenant_id(tenant_id: Optional[TenantIdType]):
     if isinstance(tenant_id, TenantId):
         return tenant_id
     else:
-        return TenantId(str(tenant_id))
-    
+        return _get_tenant_id(str(tenant_id))
+
+@lru_cache(maxsize=TENANT_ID_CACHE_SIZE)
+def _get_tenant_id(value: str) -> TenantId:
+    # Deployments use a small, fixed set of tenants, so instances are reused rather than revalidated
+    return TenantId(value)
@@ -4,4 +4,7 @@
 from typing import List, Any
 
 def first_non_none(items:List[Any]):
-    return next((item for item in items if item is not None), None)
\ No newline at end of file
+    for item in items:
+        if item is not None:
+            return item
+    return None
@@ -35,6 +35,14 @@ def default_id_gen_with_delimiter(default_tenant):
     return IdGenerator(tenant_id=default_tenant, include_classification_in_entity_id=True, use_chunk_id_delimiter=True)
 
 
+@pytest.fixture
+def default_id_gen_with_byte_delimiter(default_tenant):
+    '''
+    Fixture for ID generator with the 0xFF byte delimiter enabled.
+    '''
+    return IdGenerator(tenant_id=default_tenant, include_classification_in_entity_id=True, use_byte_chunk_id_delimiter=True)
+
+
 @pytest.fixture
 def custom_id_gen(custom_tenant):
     '''
@@ -0,0 +1,27 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import CSVReaderConfig
+from graphrag_toolkit.lexical_graph.indexing.load.readers.providers.csv_reader_provider import CSVReaderProvider
+
+
+@pytest.mark.parametrize("backend", ["pandas", "arrow"])
+@pytest.mark.parametrize("concat_rows,expected", [
+    (True, ["1, x\n2, nan"]),
+    (False, ["1, x", "2, nan"]),
+])
+def test_backends_lay_out_rows_alike(tmp_path, backend, concat_rows, expected):
+    """Both backends are initialized through the base provider and produce the same row layout."""
+    if backend == "arrow":
+        pytest.importorskip("pyarrow")
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,x\n2,\n")
+    config = CSVReaderConfig(backend=backend, concat_rows=concat_rows)
+    provider = CSVReaderProvider(config)
+
+    docs = provider.read(str(path))
+
+    assert provider.config is config
+    assert [doc.text for doc in docs] == expected
@@ -0,0 +1,31 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime
+import sys
+import types
+
+from graphrag_toolkit.lexical_graph.indexing.load.readers.providers.document_graph_reader_provider import _encode_json
+
+
+VALUE = {
+    'values': [1.0, 0.1, float('nan'), float('inf')],
+    'keys': {1: 'a', None: 'b'},
+    'created': datetime.date(2024, 1, 2),
+    'name': 'café'
+}
+
+
+def test_json_metadata_does_not_depend_on_orjson(monkeypatch):
+    """JSON metadata feeds document IDs, so it is the same whether or not orjson is installed."""
+    monkeypatch.setitem(sys.modules, 'orjson', None)
+    without_orjson = _encode_json(VALUE)
+
+    fake_orjson = types.ModuleType('orjson')
+    fake_orjson.dumps = lambda *args, **kwargs: b'"orjson"'
+    fake_orjson.OPT_NON_STR_KEYS = 0
+    monkeypatch.setitem(sys.modules, 'orjson', fake_orjson)
+
+    assert _encode_json(VALUE) == without_orjson == (
+        '{"values":[1.0,0.1,NaN,Infinity],"keys":{"1":"a","null":"b"},"created":"2024-01-02","name":"café"}'
+    )
@@ -199,6 +199,34 @@ class TestDelimiterModeComparison:
         )
 
 
+class TestCreateChunkIdByteDelimiter:
+    """Tests for IdGenerator.create_chunk_id with the 0xFF byte delimiter enabled."""
+
+    def test_create_chunk_id_no_collision_with_null_in_text(self, default_id_gen_with_delimiter, default_id_gen_with_byte_delimiter):
+        """
+        Test that text containing null characters cannot collide.
+
+        With the null character delimiter, ("a\\x00b", "c") and ("a", "b\\x00c") hash the
+        same bytes. A 0xFF byte cannot occur in UTF-8 text, so these remain distinct.
+        """
+        source_id = "aws::12345678:abcd"
+        null_id_gen = default_id_gen_with_delimiter
+        byte_id_gen = default_id_gen_with_byte_delimiter
+
+        assert null_id_gen.create_chunk_id(source_id, "a\x00b", "c") == null_id_gen.create_chunk_id(source_id, "a", "b\x00c")
+        assert byte_id_gen.create_chunk_id(source_id, "a\x00b", "c") != byte_id_gen.create_chunk_id(source_id, "a", "b\x00c")
+        assert byte_id_gen.create_chunk_id(source_id, "hello", "world") != byte_id_gen.create_chunk_id(source_id, "hell", "oworld")
+
+    def test_create_chunk_id_byte_delimiter_changes_ids(self, default_id_gen, default_id_gen_with_delimiter, default_id_gen_with_byte_delimiter):
+        """Test that the byte delimiter is a distinct mode from the existing ones."""
+        source_id = "aws::12345678:abcd"
+
+        byte_id = default_id_gen_with_byte_delimiter.create_chunk_id(source_id, "hello", "world")
+
+        assert byte_id != default_id_gen.create_chunk_id(source_id, "hello", "world")
+        assert byte_id != default_id_gen_with_delimiter.create_chunk_id(source_id, "hello", "world")
+
+
 class TestCreateSourceId:
     """Tests for IdGenerator.create_source_id method."""
 
@@ -0,0 +1,26 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from dataclasses import dataclass
+
+from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import PDFReaderConfig
+from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config_base import ReaderProviderConfig
+
+
+@dataclass
+class _RequiredFieldConfig(ReaderProviderConfig):
+    api_key: str
+    limit: int = 10
+
+
+def test_subclass_can_declare_required_fields():
+    config = _RequiredFieldConfig('key', 5, s3_memory_temp_dir=True)
+
+    assert (config.api_key, config.limit, config.s3_memory_temp_dir) == ('key', 5, True)
+
+
+def test_positional_arguments_bind_to_subclass_fields():
+    config = PDFReaderConfig(True)
+
+    assert config.return_full_document is True
+    assert config.s3_memory_temp_dir is False
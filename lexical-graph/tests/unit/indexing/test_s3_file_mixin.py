@@ -0,0 +1,150 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import errno
+import io
+import os
+import tempfile
+from dataclasses import dataclass
+
+import pytest
+
+from graphrag_toolkit.lexical_graph.indexing.load.readers import s3_file_mixin
+from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config_base import ReaderProviderConfig
+from graphrag_toolkit.lexical_graph.indexing.load.readers.s3_file_mixin import S3FileMixin
+
+
+@dataclass
+class _Config(ReaderProviderConfig):
+    pass
+
+
+class _Provider(S3FileMixin):
+    def __init__(self, config):
+        self.config = config
+        self.metadata_fn = None
+
+
+class _FakeS3Client:
+    def __init__(self, body):
+        self.body = body
+
+    def get_object(self, Bucket, Key, Range):
+        return {'Body': self.body, 'ContentRange': None}
+
+
+class _FullDiskBody(io.BytesIO):
+    def read(self, *args):
+        raise OSError(errno.ENOSPC, 'No space left on device')
+
+
+@pytest.fixture
+def memory_dir(tmp_path, monkeypatch):
+    path = tmp_path / 'shm'
+    path.mkdir()
+    monkeypatch.setattr(s3_file_mixin, '_get_memory_temp_dir', lambda: str(path))
+    monkeypatch.setattr(s3_file_mixin, 'MEMORY_TEMP_DIR_MIN_FREE_BYTES', 0)
+    return path
+
+
+def _download(provider, body):
+    temp_path = provider._download_small_s3_file(_FakeS3Client(body), 'bucket', 'key.txt', '.txt')
+    with open(temp_path, 'rb') as f:
+        assert f.read() == b'data'
+    os.unlink(temp_path)
+    return os.path.dirname(temp_path)
+
+
+def test_small_objects_use_default_temp_dir_unless_opted_in(memory_dir):
+    assert _download(_Provider(_Config()), io.BytesIO(b'data')) == tempfile.gettempdir()
+
+
+def test_small_objects_use_memory_temp_dir_when_opted_in(memory_dir):
+    assert _download(_Provider(_Config(s3_memory_temp_dir=True)), io.BytesIO(b'data')) == str(memory_dir)
+
+
+def test_memory_temp_dir_skipped_when_low_on_space(memory_dir, monkeypatch):
+    monkeypatch.setattr(s3_file_mixin, 'MEMORY_TEMP_DIR_MIN_FREE_BYTES', 2 ** 62)
+    assert _download(_Provider(_Config(s3_memory_temp_dir=True)), io.BytesIO(b'data')) == tempfile.gettempdir()
+
+
+def test_memory_temp_dir_falls_back_on_enospc(memory_dir):
+    bodies = iter([_FullDiskBody(), io.BytesIO(b'data')])
+    provider = _Provider(_Config(s3_memory_temp_dir=True))
+    client = _FakeS3Client(None)
+    client.get_object = lambda Bucket, Key, Range: {'Body': next(bodies), 'ContentRange': None}
+
+    temp_path = provider._download_small_s3_file(client, 'bucket', 'key.txt', '.txt')
+
+    assert os.path.dirname(temp_path) == tempfile.gettempdir()
+    assert os.listdir(memory_dir) == []
+    os.unlink(temp_path)
+
+
+class _HeadS3Client:
+    def __init__(self):
+        self.calls = 0
+
+    def head_object(self, Bucket, Key):
+        self.calls += 1
+        return {'ContentLength': 10}
+
+
+def test_file_size_cache_is_per_provider_and_bounded(monkeypatch):
+    from graphrag_toolkit.lexical_graph.config import _GraphRAGConfig
+
+    client = _HeadS3Client()
+    monkeypatch.setattr(_GraphRAGConfig, 's3', property(lambda self: client))
+    monkeypatch.setattr(s3_file_mixin, 'FILE_SIZE_CACHE_SIZE', 2)
+    provider = _Provider(_Config())
+
+    for key in ('a', 'b', 'a', 'c'):
+        assert provider._get_s3_file_size(f's3://bucket/{key}') == 10
+
+    assert client.calls == 3
+    assert list(provider._s3_file_sizes) == ['s3://bucket/b', 's3://bucket/c']
+    assert _Provider(_Config())._s3_file_sizes == {}
+
+
+class _RangedS3Client:
+    def __init__(self, data):
+        self.data = data
+
+    def get_object(self, Bucket, Key, Range):
+        end = int(Range.rsplit('-', 1)[1])
+        return {
+            'Body': io.BytesIO(self.data[:end + 1]),
+            'ContentRange': f'bytes 0-{min(end, len(self.data) - 1)}/{len(self.data)}'
+        }
+
+
+def test_read_s3_file_only_reads_objects_within_limit(monkeypatch):
+    from graphrag_toolkit.lexical_graph.config import _GraphRAGConfig
+
+    client = _RangedS3Client(b'data')
+    monkeypatch.setattr(_GraphRAGConfig, 's3', property(lambda self: client))
+    provider = _Provider(_Config())
+
+    assert provider._read_s3_file('s3://bucket/small', 4) == b'data'
+    assert provider._read_s3_file('s3://bucket/large', 3) is None
+    assert provider._s3_file_sizes == {'s3://bucket/large': 4}
+
+
+class _PresigningS3Client:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_presigned_url(self, ClientMethod, Params, ExpiresIn):
+        self.calls += 1
+        return f"https://{Params['Bucket']}/{Params['Key']}?signature={self.calls}"
+
+
+def test_presigned_urls_are_signed_with_current_credentials(monkeypatch):
+    from graphrag_toolkit.lexical_graph.config import _GraphRAGConfig
+
+    client = _PresigningS3Client()
+    monkeypatch.setattr(_GraphRAGConfig, 's3', property(lambda self: client))
+    provider = _Provider(_Config())
+
+    assert provider._get_s3_stream_url('s3://bucket/key') == 'https://bucket/key?signature=1'
+    assert provider._get_s3_stream_url('s3://bucket/key') == 'https://bucket/key?signature=2'
@@ -0,0 +1,102 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import StructuredDataReaderConfig
+from graphrag_toolkit.lexical_graph.indexing.load.readers.providers.structured_data_reader_provider import StructuredDataReaderProvider
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,x\n2,y\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("engine", [None, "c", "python", "pyarrow"])
+def test_read_csv_with_pandas_engine(csv_file, engine):
+    """Local CSV files are read with any pandas engine, including pyarrow, which rejects memory_map."""
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    pandas_config = {"engine": engine} if engine else None
+    provider = StructuredDataReaderProvider(StructuredDataReaderConfig(col_index=["a", "b"], col_joiner="|", pandas_config=pandas_config))
+
+    docs = provider.read(csv_file)
+
+    assert [doc.text for doc in docs] == ["1|x", "2|y"]
+
+
+def test_read_csv_with_pyarrow_engine_and_column_positions(csv_file):
+    """Column positions are not pushed into usecols for the pyarrow engine, which only accepts names."""
+    pytest.importorskip("pyarrow")
+    provider = StructuredDataReaderProvider(StructuredDataReaderConfig(col_index=[1, 0], col_joiner="|", pandas_config={"engine": "pyarrow"}))
+
+    docs = provider.read(csv_file)
+
+    assert [doc.text for doc in docs] == ["x|1", "y|2"]
+
+
+@pytest.mark.parametrize("backend,expected", [
+    ("pandas", ["1|2.0|x|True"]),
+    ("arrow", ["1|2|x|true"]),     # arrow's own float and boolean formatting
+])
+def test_backend_value_formatting(tmp_path, backend, expected):
+    """The backends format floats and booleans differently, as documented on StructuredDataReaderConfig.backend."""
+    if backend == "arrow":
+        pytest.importorskip("pyarrow")
+    path = tmp_path / "values.csv"
+    path.write_text("i,f,s,b\n1,2.0,x,True\n")
+    provider = StructuredDataReaderProvider(StructuredDataReaderConfig(col_index=[0, 1, 2, 3], col_joiner="|", backend=backend))
+
+    docs = provider.read(str(path))
+
+    assert [doc.text for doc in docs] == expected
+
+
+def test_arrow_backend_formats_pandas_parsed_files(tmp_path):
+    """Files pandas parses under the arrow backend (here a JSON array) are joined and formatted by arrow."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "values.json"
+    path.write_text('[{"i": 1, "f": 2.0, "s": "x", "b": true}]')
+    provider = StructuredDataReaderProvider(StructuredDataReaderConfig(col_index=["i", "f", "s", "b"], col_joiner="|", backend="arrow"))
+
+    docs = provider.read(str(path))
+
+    assert [doc.text for doc in docs] == ["1|2|x|true"]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_failed_file_raises(csv_file, max_workers):
+    """A file that fails to parse raises, whether files are read sequentially or on a thread pool."""
+    provider = StructuredDataReaderProvider(StructuredDataReaderConfig(col_index="missing", max_workers=max_workers))
+
+    with pytest.raises(ValueError):
+        provider.read([csv_file, csv_file])
+
+
+def test_failed_file_skipped_when_opted_in(csv_file, tmp_path):
+    """With skip_failed_files, a file that fails to parse yields no documents and the others are still read."""
+    path = tmp_path / "other.csv"
+    path.write_text("c\n3\n")
+    provider = StructuredDataReaderProvider(StructuredDataReaderConfig(col_index="c", skip_failed_files=True))
+
+    docs = provider.read([csv_file, str(path)])
+
+    assert [doc.text for doc in docs] == ["3"]
+
+
+@pytest.mark.filterwarnings("ignore::pandas.errors.ParserWarning")  # pandas switching to its python engine
+@pytest.mark.parametrize("sep", ["::", r"\s*;\s*"])
+def test_arrow_backend_falls_back_to_pandas_for_multi_character_separators(tmp_path, sep):
+    """Arrow's CSV parser only takes a single-character delimiter, so other separators are parsed by pandas."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "data.csv"
+    path.write_text("a::b\n1::x\n" if sep == "::" else "a ; b\n1; x\n")
+    provider = StructuredDataReaderProvider(StructuredDataReaderConfig(
+        col_index=["a", "b"], col_joiner="|", backend="arrow", pandas_config={"sep": sep}
+    ))
+
+    docs = provider.read(str(path))
+
+    assert [doc.text for doc in docs] == ["1|x"]
@@ -0,0 +1,88 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+import types
+
+import pytest
+
+from graphrag_toolkit.lexical_graph.indexing.load.readers.providers import wikipedia_reader_provider
+from graphrag_toolkit.lexical_graph.indexing.load.readers.providers.wikipedia_reader_provider import WikipediaReaderProvider, _pooled_requests
+from graphrag_toolkit.lexical_graph.indexing.load.readers.reader_provider_config import WikipediaReaderConfig
+
+
+@pytest.fixture
+def wikipedia_api(monkeypatch):
+    wikipedia_api = types.ModuleType('wikipedia.wikipedia')
+    wikipedia_api.requests = original_requests = object()
+    package = types.ModuleType('wikipedia')
+    package.wikipedia = wikipedia_api
+    monkeypatch.setitem(sys.modules, 'wikipedia', package)
+    monkeypatch.setitem(sys.modules, 'wikipedia.wikipedia', wikipedia_api)
+    return wikipedia_api, original_requests
+
+
+def test_pooled_requests_are_restored_after_last_reader(wikipedia_api):
+    wikipedia_api, original_requests = wikipedia_api
+
+    with _pooled_requests():
+        pooled_requests = wikipedia_api.requests
+        assert pooled_requests is not original_requests
+        with _pooled_requests():
+            assert wikipedia_api.requests is pooled_requests
+        assert wikipedia_api.requests is pooled_requests
+
+    assert wikipedia_api.requests is original_requests
+    assert wikipedia_reader_provider._session_users == 0
+
+
+def test_pooled_requests_are_restored_on_error(wikipedia_api):
+    wikipedia_api, original_requests = wikipedia_api
+
+    with pytest.raises(ValueError):
+        with _pooled_requests():
+            raise ValueError()
+
+    assert wikipedia_api.requests is original_requests
+
+
+def _query_response(params):
+    titles = params['titles'].split('|')
+    pages = {}
+    for i, title in enumerate(titles):
+        if title == 'Missing':
+            pages[f'-{i}'] = {'title': title, 'missing': ''}
+        elif title == 'Ambiguous':
+            pages[str(i)] = {'title': title, 'fullurl': f'url/{title}', 'pageprops': {'disambiguation': ''}}
+        else:
+            title = 'Amazon Web Services' if title == 'aws' else title
+            pages[str(i)] = {'title': title, 'fullurl': f'url/{title}'}
+    return {'query': {
+        'normalized': [{'from': 'aws', 'to': 'Aws'}],
+        'redirects': [{'from': 'Aws', 'to': 'Amazon Web Services'}],
+        'pages': pages
+    }}
+
+
+def test_resolve_pages_batches_titles_and_follows_redirects(wikipedia_api, monkeypatch):
+    wikipedia_api, _ = wikipedia_api
+    requests = []
+    wikipedia_api._wiki_request = lambda params: requests.append(params) or _query_response(params)
+    monkeypatch.setattr(wikipedia_reader_provider, 'MAX_TITLES_PER_QUERY', 2)
+
+    resolved_pages = WikipediaReaderProvider(WikipediaReaderConfig())._resolve_pages(
+        ['aws', 'Missing', 'Ambiguous', 'Other', 'aws']
+    )
+
+    assert [params['titles'] for params in requests] == ['aws|Missing', 'Ambiguous|Other']
+    assert resolved_pages == {'aws': ('0', 'url/Amazon Web Services'), 'Other': ('1', 'url/Other')}
+
+
+def test_load_page_fetches_resolved_page_by_id(wikipedia_api):
+    wikipedia_api, _ = wikipedia_api
+    wikipedia_api._wiki_request = lambda params: {'query': {'pages': {params['pageids']: {'extract': 'text'}}}}
+
+    page, documents = WikipediaReaderProvider(WikipediaReaderConfig())._load_page(None, 'aws', ('7', 'url/aws'))
+
+    assert page == 'aws'
+    assert [(doc.id_, doc.text, doc.metadata) for doc in documents] == [('7', 'text', {'url': 'url/aws'})]
@@ -35,6 +35,7 @@ import re
 import pytest
 from graphrag_toolkit.lexical_graph.tenant_id import TenantId
 from graphrag_toolkit.lexical_graph.indexing.id_generator import IdGenerator
+from graphrag_toolkit.lexical_graph.indexing.utils.hash_utils import get_hash
 
 
 # --- create_source_id ---
@@ -122,6 +123,13 @@ def test_create_entity_id_space_normalization(default_id_gen):
     assert default_id_gen.create_entity_id("New York", "Location") == default_id_gen.create_entity_id("new york", "Location")
 
 
+def test_create_entity_id_non_ascii_normalized_per_value(default_id_gen):
+    """Non-ASCII values are lowercased on their own, not as part of the joined key,
+    so context-sensitive mappings such as the Greek final sigma are stable.
+    """
+    assert default_id_gen.create_fact_id("\u03a3") == get_hash("fact::\u03c3")
+
+
 # --- create_topic_id ---
 
 
@@ -164,6 +172,67 @@ def test_create_fact_id_different_values(default_id_gen):
     assert default_id_gen.create_fact_id("fact A") != default_id_gen.create_fact_id("fact B")
 
 
+# --- node ID cache ---
+
+
+def test_cached_node_ids_match_uncached(default_id_gen, custom_id_gen):
+    """Memoized node IDs are identical to freshly computed ones, and the cache never
+    returns one tenant's ID for another tenant.
+    """
+    for gen in (default_id_gen, custom_id_gen, default_id_gen):
+        uncached = gen._create_node_id("entity", "Amazon", "Company", use_cache=False)
+        assert gen.create_entity_id("Amazon", "Company") == uncached
+        assert gen.create_entity_id("Amazon", "Company") == uncached
+    assert default_id_gen.create_entity_id("Amazon", "Company") != custom_id_gen.create_entity_id("Amazon", "Company")
+
+
+# --- hash_algorithm ---
+
+
+def test_hash_algorithm_defaults_to_md5(default_id_gen):
+    """IDs are MD5-based by default, so existing graphs keep their node IDs."""
+    assert default_id_gen.hash_algorithm == "md5"
+
+
+def test_hash_algorithm_changes_ids(default_tenant, default_id_gen):
+    """Switching the hash algorithm produces a different, same-length ID space."""
+    pytest.importorskip("blake3")
+    gen = IdGenerator(tenant_id=default_tenant, include_classification_in_entity_id=True, hash_algorithm="blake3")
+    id1 = default_id_gen.create_entity_id("Amazon", "Company")
+    id2 = gen.create_entity_id("Amazon", "Company")
+    assert id1 != id2
+    assert len(id1) == len(id2)
+
+
+def test_hash_algorithm_is_case_insensitive(default_tenant):
+    """Algorithm names are lowercased, so 'SHA256' selects the same IDs as 'sha256'."""
+    gen = IdGenerator(tenant_id=default_tenant, include_classification_in_entity_id=True, hash_algorithm="SHA256")
+    assert gen.hash_algorithm == "sha256"
+
+
+def test_unsupported_hash_algorithm_raises_on_init(default_tenant):
+    """An unsupported algorithm fails when the generator is created, not on the first ID."""
+    with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+        IdGenerator(tenant_id=default_tenant, include_classification_in_entity_id=True, hash_algorithm="sha1")
+
+
+def test_config_hash_algorithm_is_validated(monkeypatch):
+    """GraphRAGConfig lowercases and validates the algorithm from both the setter and HASH_ALGORITHM."""
+    from graphrag_toolkit.lexical_graph.config import _GraphRAGConfig
+
+    config = _GraphRAGConfig()
+    config.hash_algorithm = "MD5"
+    assert config.hash_algorithm == "md5"
+    with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+        config.hash_algorithm = "md-5"
+
+    monkeypatch.setenv("HASH_ALGORITHM", "Sha256")
+    assert _GraphRAGConfig().hash_algorithm == "sha256"
+    monkeypatch.setenv("HASH_ALGORITHM", "crc32")
+    with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+        _GraphRAGConfig().hash_algorithm
+
+
 # --- rewrite_id_for_tenant ---
 
 
@@ -168,3 +168,13 @@ def test_to_tenant_id_from_string():
     result = to_tenant_id("acme")
     assert isinstance(result, TenantId)
     assert result.value == "acme"
+
+
+def test_to_tenant_id_reuses_instances():
+    """Repeated tenant strings resolve to the same validated instance; invalid
+    strings are still rejected every time.
+    """
+    assert to_tenant_id("acme") is to_tenant_id("acme")
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            to_tenant_id("Acme")
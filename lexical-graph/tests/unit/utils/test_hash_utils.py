@@ -15,7 +15,7 @@ will be caught immediately.
 import re
 
 import pytest
-from graphrag_toolkit.lexical_graph.indexing.utils.hash_utils import get_hash
+from graphrag_toolkit.lexical_graph.indexing.utils.hash_utils import get_hash, get_hash_parts, get_hash_prefix, get_affixed_hash
 
 
 def test_get_hash_deterministic():
@@ -73,3 +73,56 @@ def test_get_hash_hex_format():
     length and character set must be exact.
     """
     assert re.match(r"^[a-f0-9]{32}$", get_hash("arbitrary input"))
+
+
+def test_get_hash_blake3_format():
+    """BLAKE3 digests are truncated to 16 bytes, so IDs keep the same
+    32-char lowercase hex format as MD5-based IDs.
+    """
+    pytest.importorskip("blake3")
+    result = get_hash("hello", "blake3")
+    assert re.match(r"^[a-f0-9]{32}$", result)
+    assert result != get_hash("hello")
+
+
+def test_get_hash_sha256_format():
+    """SHA-256 digests are truncated to 32 hex characters, matching the leading
+    characters of the full digest, so IDs keep the same format as MD5-based IDs.
+    """
+    result = get_hash("hello", "sha256")
+    assert result == "2cf24dba5fb0a30e26e83b2ac5b9e29e"
+    assert get_hash_parts(["hel", "lo"], "sha256") == result
+
+
+def test_get_hash_unsupported_algorithm():
+    """An unknown hash algorithm is rejected rather than silently falling back to MD5."""
+    with pytest.raises(ValueError):
+        get_hash("hello", "crc32")
+
+
+def test_get_hash_parts_matches_concatenation():
+    """Hashing parts incrementally produces the same digest as hashing their
+    concatenation, for every supported algorithm.
+    """
+    parts = ["chunk text ", "café", "\x00", '{"source": "doc"}']
+    assert get_hash_parts(parts) == get_hash("".join(parts))
+    pytest.importorskip("blake3")
+    assert get_hash_parts(parts, "blake3") == get_hash("".join(parts), "blake3")
+
+
+def test_get_hash_prefix_matches_truncated_get_hash():
+    """get_hash_prefix returns the same leading characters that source and chunk IDs
+    previously took by slicing the full digest.
+    """
+    for length in (4, 8, 32):
+        assert get_hash_prefix("hello", length) == get_hash("hello")[:length]
+
+
+def test_get_affixed_hash_matches_concatenation():
+    """Hashing from a precomputed prefix state produces the same digests as hashing
+    the concatenated string, with and without a suffix.
+    """
+    values = ["entity::café", "", "topic::x"]
+    for prefix, suffix in (("acme::", ""), ("acme::", "::tail"), ("", ""), ("", "::tail")):
+        expected = [get_hash(prefix + v + suffix) for v in values]
+        assert [get_affixed_hash(prefix, v, suffix) for v in values] == expected
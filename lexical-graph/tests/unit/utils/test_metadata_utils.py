@@ -11,14 +11,18 @@ import datetime
 import re
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
+from graphrag_toolkit.lexical_graph.indexing.utils import metadata_utils
 from graphrag_toolkit.lexical_graph.indexing.utils.metadata_utils import (
     get_properties_str,
     last_accessed_date,
     remove_collection_items_from_metadata
 )
 
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_FAKE_NOW = datetime.datetime(2025, 6, 15, 12, 0, 0)
+
 
 # ---------------------------------------------------------------------------
 # get_properties_str
@@ -49,17 +53,21 @@ def test_last_accessed_date_returns_dict():
 def test_last_accessed_date_format():
     """Date value matches YYYY-MM-DD format."""
     result = last_accessed_date()
-    assert re.match(r"^\d{4}-\d{2}-\d{2}$", result["last_accessed_date"])
+    assert _DATE_RE.match(result["last_accessed_date"])
+
 
+@pytest.fixture
+def frozen_datetime(monkeypatch):
+    """Replaces the datetime module seen by metadata_utils with one whose now() is fixed."""
+    mock_dt = MagicMock()
+    mock_dt.datetime.now.return_value = _FAKE_NOW
+    monkeypatch.setattr(metadata_utils, "datetime", mock_dt)
+    return _FAKE_NOW
 
-def test_last_accessed_date_mocked():
+
+def test_last_accessed_date_mocked(frozen_datetime):
     """With a mocked datetime, the returned date matches the fixed value."""
-    fake_now = datetime.datetime(2025, 6, 15, 12, 0, 0)
-    with patch(
-        "graphrag_toolkit.lexical_graph.indexing.utils.metadata_utils.datetime"
-    ) as mock_dt:
-        mock_dt.datetime.now.return_value = fake_now
-        result = last_accessed_date()
+    result = last_accessed_date()
     assert result == {"last_accessed_date": "2025-06-15"}
 
 
@@ -127,33 +127,26 @@ proposition: CO2 causes warming
 CO2|causes warming|Earth"""
 
 
-def test_parse_single_topic_count():
-    topics, garbage = parse_extracted_topics(SINGLE_TOPIC_INPUT)
-    assert len(topics.topics) == 1
-
-
-def test_parse_single_topic_value():
-    topics, _ = parse_extracted_topics(SINGLE_TOPIC_INPUT)
-    assert topics.topics[0].value == "Climate Change"
-
-
-def test_parse_single_topic_entities():
-    topics, _ = parse_extracted_topics(SINGLE_TOPIC_INPUT)
-    assert len(topics.topics[0].entities) == 2
-
-
-def test_parse_single_topic_statements():
-    topics, _ = parse_extracted_topics(SINGLE_TOPIC_INPUT)
-    assert len(topics.topics[0].statements) == 1
-
-
-def test_parse_single_topic_facts():
-    topics, _ = parse_extracted_topics(SINGLE_TOPIC_INPUT)
-    assert len(topics.topics[0].statements[0].facts) == 1
-
-
-def test_parse_single_topic_no_garbage():
-    _, garbage = parse_extracted_topics(SINGLE_TOPIC_INPUT)
+@pytest.fixture(scope="module")
+def single_topic_parsed():
+    # Parse results are shared by the tests for each input; tests must not mutate them
+    return parse_extracted_topics(SINGLE_TOPIC_INPUT)
+
+
+@pytest.mark.parametrize("getter,expected", [
+    (lambda t: len(t.topics), 1),                               # one topic
+    (lambda t: t.topics[0].value, "Climate Change"),            # topic value
+    (lambda t: len(t.topics[0].entities), 2),                   # both entities
+    (lambda t: len(t.topics[0].statements), 1),                 # one statement
+    (lambda t: len(t.topics[0].statements[0].facts), 1),        # one fact
+], ids=["count", "value", "entities", "statements", "facts"])
+def test_parse_single_topic(single_topic_parsed, getter, expected):
+    topics, _ = single_topic_parsed
+    assert getter(topics) == expected
+
+
+def test_parse_single_topic_no_garbage(single_topic_parsed):
+    _, garbage = single_topic_parsed
     assert not garbage
 
 
@@ -175,15 +168,14 @@ proposition: GDP grows
 GDP|grows|GDP"""
 
 
-def test_parse_multiple_topics_count():
-    topics, _ = parse_extracted_topics(MULTI_TOPIC_INPUT)
-    assert len(topics.topics) == 2
+@pytest.fixture(scope="module")
+def multi_topic_parsed():
+    return parse_extracted_topics(MULTI_TOPIC_INPUT)
 
 
-def test_parse_multiple_topics_values():
-    topics, _ = parse_extracted_topics(MULTI_TOPIC_INPUT)
-    assert topics.topics[0].value == "Climate"
-    assert topics.topics[1].value == "Economy"
+def test_parse_multiple_topics(multi_topic_parsed):
+    topics, _ = multi_topic_parsed
+    assert [t.value for t in topics.topics] == ["Climate", "Economy"]
 
 
 # ---------------------------------------------------------------------------
@@ -240,26 +232,31 @@ proposition: Something happens
 UnknownSubject|does|KnownEntity"""
 
 
-def test_parse_unknown_subject_subject_is_local_entity():
+@pytest.fixture(scope="module")
+def unknown_subject_parsed():
+    return parse_extracted_topics(UNKNOWN_SUBJECT_INPUT)
+
+
+def test_parse_unknown_subject_subject_is_local_entity(unknown_subject_parsed):
     """When neither subject nor object is in the entity dict, the subject gets
     LOCAL_ENTITY_CLASSIFICATION."""
-    topics, _ = parse_extracted_topics(UNKNOWN_SUBJECT_INPUT)
+    topics, _ = unknown_subject_parsed
     fact = topics.topics[0].statements[0].facts[0]
     assert fact.subject.classification == LOCAL_ENTITY_CLASSIFICATION
 
 
-def test_parse_unknown_subject_complement_is_local_entity():
+def test_parse_unknown_subject_complement_is_local_entity(unknown_subject_parsed):
     """When the subject is unknown, the complement also gets LOCAL_ENTITY_CLASSIFICATION
     (the code falls into the else-branch that creates two local entities)."""
-    topics, _ = parse_extracted_topics(UNKNOWN_SUBJECT_INPUT)
+    topics, _ = unknown_subject_parsed
     fact = topics.topics[0].statements[0].facts[0]
     assert fact.complement.classification == LOCAL_ENTITY_CLASSIFICATION
     assert fact.complement.value == "KnownEntity"
 
 
-def test_parse_unknown_subject_adds_detail():
+def test_parse_unknown_subject_adds_detail(unknown_subject_parsed):
     """The else-branch also appends the raw line to statement.details."""
-    topics, _ = parse_extracted_topics(UNKNOWN_SUBJECT_INPUT)
+    topics, _ = unknown_subject_parsed
     stmt = topics.topics[0].statements[0]
     assert len(stmt.details) == 1
 
@@ -277,24 +274,29 @@ proposition: Known does something
 KnownEntity|relates to|UnknownObject"""
 
 
-def test_parse_unknown_object_subject_is_known():
+@pytest.fixture(scope="module")
+def unknown_object_parsed():
+    return parse_extracted_topics(UNKNOWN_OBJECT_INPUT)
+
+
+def test_parse_unknown_object_subject_is_known(unknown_object_parsed):
     """Subject is in the entity dict -> uses the known entity."""
-    topics, _ = parse_extracted_topics(UNKNOWN_OBJECT_INPUT)
+    topics, _ = unknown_object_parsed
     fact = topics.topics[0].statements[0].facts[0]
     assert fact.subject.value == "KnownEntity"
 
 
-def test_parse_unknown_object_complement_is_local_entity():
+def test_parse_unknown_object_complement_is_local_entity(unknown_object_parsed):
     """Object not in entity dict -> complement gets LOCAL_ENTITY_CLASSIFICATION."""
-    topics, _ = parse_extracted_topics(UNKNOWN_OBJECT_INPUT)
+    topics, _ = unknown_object_parsed
     fact = topics.topics[0].statements[0].facts[0]
     assert fact.complement.classification == LOCAL_ENTITY_CLASSIFICATION
     assert fact.complement.value == "UnknownObject"
 
 
-def test_parse_unknown_object_fact_object_is_none():
+def test_parse_unknown_object_fact_object_is_none(unknown_object_parsed):
     """When the complement path is used, fact.object remains None."""
-    topics, _ = parse_extracted_topics(UNKNOWN_OBJECT_INPUT)
+    topics, _ = unknown_object_parsed
     fact = topics.topics[0].statements[0].facts[0]
     assert fact.object is None
 
@@ -313,15 +315,20 @@ proposition: Good exists
 Good|exists|Good"""
 
 
-def test_parse_unparseable_entity_goes_to_garbage():
+@pytest.fixture(scope="module")
+def bad_entity_parsed():
+    return parse_extracted_topics(BAD_ENTITY_INPUT)
+
+
+def test_parse_unparseable_entity_goes_to_garbage(bad_entity_parsed):
     """An entity line without exactly one '|' is appended to garbage."""
-    _, garbage = parse_extracted_topics(BAD_ENTITY_INPUT)
-    assert any("UNPARSEABLE ENTITY" in g for g in garbage)
+    _, garbage = bad_entity_parsed
+    assert any(g.startswith("UNPARSEABLE ENTITY:") for g in garbage)
 
 
-def test_parse_unparseable_entity_valid_entity_still_parsed():
+def test_parse_unparseable_entity_valid_entity_still_parsed(bad_entity_parsed):
     """The bad line does not prevent the valid entity on the next line from being parsed."""
-    topics, _ = parse_extracted_topics(BAD_ENTITY_INPUT)
+    topics, _ = bad_entity_parsed
     assert len(topics.topics[0].entities) == 1
 
 
@@ -338,18 +345,23 @@ proposition: Some statement
 only two segments here"""
 
 
-def test_parse_unparseable_relationship_becomes_detail():
+@pytest.fixture(scope="module")
+def bad_relationship_parsed():
+    return parse_extracted_topics(BAD_RELATIONSHIP_INPUT)
+
+
+def test_parse_unparseable_relationship_becomes_detail(bad_relationship_parsed):
     """A relationship line without three '|'-delimited segments but with non-empty
     text is appended to statement.details (not to garbage)."""
-    topics, _ = parse_extracted_topics(BAD_RELATIONSHIP_INPUT)
+    topics, _ = bad_relationship_parsed
     stmt = topics.topics[0].statements[0]
     assert len(stmt.details) == 1
 
 
-def test_parse_unparseable_relationship_not_in_garbage():
+def test_parse_unparseable_relationship_not_in_garbage(bad_relationship_parsed):
     """Non-empty single-segment lines in relationship-extraction state go to details,
     NOT to garbage."""
-    _, garbage = parse_extracted_topics(BAD_RELATIONSHIP_INPUT)
+    _, garbage = bad_relationship_parsed
     assert not any("UNPARSEABLE" in g for g in garbage)
 
 